@@ -3,8 +3,12 @@ FastAPI Application Entry Point
 Resume Parser API Server
 """
 import os
+import logging
+import queue
 from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import Tuple
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -17,11 +21,46 @@ from .service import ResumeParserService
 from .models import ErrorResponse
 
 
+def _setup_logging() -> Tuple[QueueListener, QueueHandler]:
+    """
+    Route API logs through a queue so request/worker code never blocks on stream I/O
+    
+    Safe to call again after a reload: queue handlers left by an earlier
+    start are removed first, so records are never duplicated.
+    
+    Returns:
+        Started QueueListener and the QueueHandler feeding it (pass both to
+        _teardown_logging on shutdown)
+    """
+    log_queue: queue.Queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    queue_handler = QueueHandler(log_queue)
+    
+    api_logger = logging.getLogger(__package__)
+    for handler in [h for h in api_logger.handlers if isinstance(h, QueueHandler)]:
+        api_logger.removeHandler(handler)
+    api_logger.setLevel(os.getenv('LOG_LEVEL', 'INFO').upper())
+    api_logger.addHandler(queue_handler)
+    api_logger.propagate = False
+    
+    listener.start()
+    return listener, queue_handler
+
+
+def _teardown_logging(listener: QueueListener, queue_handler: QueueHandler):
+    """Detach the queue handler, then stop the listener (flushing pending records)"""
+    logging.getLogger(__package__).removeHandler(queue_handler)
+    listener.stop()
+
+
 # Lifespan context manager for startup/shutdown
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan management"""
     # Startup
+    log_listener, log_handler = _setup_logging()
     print("=" * 60)
     print("🚀 Starting Resume Parser API Server")
     print("=" * 60)
@@ -37,7 +76,7 @@ async def lifespan(app: FastAPI):
     
     # Initialize parser service
     service = ResumeParserService(model_path)
-    service.initialize()
+    await service.ainitialize()
     set_parser_service(service)
     
     print("=" * 60)
@@ -51,6 +90,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     print("\n🛑 Shutting down Resume Parser API Server...")
     service.cleanup()
+    _teardown_logging(log_listener, log_handler)
     print("✅ Shutdown complete")
 
 
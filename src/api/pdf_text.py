@@ -0,0 +1,33 @@
+"""
+PDF text extraction for the API's page-range worker processes
+
+Workers are spawned, and each one imports this module to unpickle its
+target, so it must import nothing beyond pypdfium2 (no parser stack).
+"""
+try:
+    import pypdfium2
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    pypdfium2 = None
+    PDFIUM_AVAILABLE = False
+
+
+def pages_text(pdf, start: int, stop: int) -> str:
+    """Text of pages [start, stop) of an open pypdfium2 document"""
+    parts = []
+    for i in range(start, stop):
+        page = pdf[i]
+        textpage = page.get_textpage()
+        parts.append(textpage.get_text_range())
+        textpage.close()
+        page.close()
+    return "\n".join(parts)
+
+
+def extract_pdf_range(file_path: str, start: int, stop: int) -> str:
+    """Extract pages [start, stop) of a PDF with one handle (runs in a worker process)"""
+    pdf = pypdfium2.PdfDocument(file_path)
+    try:
+        return pages_text(pdf, start, stop)
+    finally:
+        pdf.close()
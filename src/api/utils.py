@@ -7,24 +7,39 @@ from pathlib import Path
 from typing import Optional
 
 
+SUPPORTED_EXTENSIONS = frozenset({'.pdf', '.docx', '.doc', '.txt'})
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# MIME types for the extensions we handle; avoids loading the system mime database
+_MIME_TYPES = {
+    '.pdf': 'application/pdf',
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    '.doc': 'application/msword',
+    '.txt': 'text/plain',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+}
+
+
 def get_file_extension(filename: str) -> str:
     """Get file extension"""
-    return Path(filename).suffix.lower()
+    return os.path.splitext(filename)[1].lower()
 
 
 def is_supported_file(filename: str) -> bool:
     """Check if file type is supported"""
-    supported_extensions = ['.pdf', '.docx', '.doc', '.txt']
-    return get_file_extension(filename) in supported_extensions
+    return get_file_extension(filename) in SUPPORTED_EXTENSIONS
 
 
 def format_file_size(size_bytes: int) -> str:
     """Format file size to human-readable format"""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.2f} TB"
+    if size_bytes < 1024:
+        return f"{size_bytes:.2f} B"
+    # Each unit is 2**10 larger, so the bit length picks the bucket directly
+    shift = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (shift * 10)):.2f} {_SIZE_UNITS[shift]}"
 
 
 def sanitize_filename(filename: str) -> str:
@@ -45,5 +60,8 @@ def extract_filename_from_path(file_path: str) -> str:
 
 def get_mime_type(filename: str) -> Optional[str]:
     """Get MIME type of file"""
-    mime_type, _ = mimetypes.guess_type(filename)
+    mime_type = _MIME_TYPES.get(get_file_extension(filename))
+    if mime_type is None:
+        # Unknown extension: fall back to the system mime database
+        mime_type, _ = mimetypes.guess_type(filename)
     return mime_type
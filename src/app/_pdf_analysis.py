@@ -0,0 +1,140 @@
+"""
+Shared PDF Analysis
+===================
+
+Single-pass PDF inspection shared by FileDetector and LayoutAnalyzer.
+The document is opened and a few sample pages' words are extracted once;
+both callers derive their own fields from the returned dict.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+import fitz  # PyMuPDF
+import numpy as np
+
+
+# Content-hash keyed cache of analyze_pdf results
+PDF_ANALYSIS_CACHE_SIZE = 256
+_pdf_analysis_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_pdf_analysis_cache_lock = threading.Lock()
+
+
+def _load_pdf_bytes(pdf_path: str) -> bytes:
+    """Read the whole PDF in one unbuffered read."""
+    with open(pdf_path, 'rb', buffering=0) as f:
+        return f.read()
+
+
+def _pdf_cache_key(data: bytes) -> str:
+    """Content key: hash of the whole file (already in memory for parsing)."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def analyze_pdf(pdf_path: str) -> Dict[str, Any]:
+    """
+    Analyze a PDF in one pass (scan check on the first page, column
+    counts over sample pages).
+
+    Results are cached by file content, so repeated analysis of the same
+    document (even under a different path) does not reopen the PDF.
+
+    Returns:
+        Dictionary with:
+        - num_pages: int
+        - page_dimensions: tuple (width, height) of the first page
+        - is_scanned: bool (first page has almost no text)
+        - has_text_layer: bool
+        - word_count: int (words on the sampled pages)
+        - left_count / right_count: sampled words starting left/right of the page midline
+        - error: str (only present if analysis failed)
+    """
+    # The file is read once; the same buffer is used for the cache key and for parsing
+    try:
+        data: Optional[bytes] = _load_pdf_bytes(pdf_path)
+        cache_key: Optional[str] = _pdf_cache_key(data)
+    except OSError:
+        data = None
+        cache_key = None
+
+    if cache_key is not None:
+        with _pdf_analysis_cache_lock:
+            cached = _pdf_analysis_cache.get(cache_key)
+            if cached is not None:
+                _pdf_analysis_cache.move_to_end(cache_key)
+                return dict(cached)
+
+    result = _analyze_pdf_uncached(pdf_path, data)
+
+    if cache_key is not None and 'error' not in result:
+        with _pdf_analysis_cache_lock:
+            _pdf_analysis_cache[cache_key] = dict(result)
+            if len(_pdf_analysis_cache) > PDF_ANALYSIS_CACHE_SIZE:
+                _pdf_analysis_cache.popitem(last=False)
+
+    return result
+
+
+def _analyze_pdf_uncached(pdf_path: str, data: Optional[bytes] = None) -> Dict[str, Any]:
+    """Open the PDF (from `data` when already read) and compute the shared analysis fields."""
+    pdf_path = os.path.abspath(pdf_path)
+
+    result = {
+        'num_pages': 0,
+        'page_dimensions': (0, 0),
+        'is_scanned': False,
+        'has_text_layer': True,
+        'word_count': 0,
+        'left_count': 0,
+        'right_count': 0,
+    }
+
+    try:
+        if data is not None:
+            doc = fitz.open(stream=data, filetype="pdf")
+        else:
+            doc = fitz.open(pdf_path)
+
+        # Context manager gives one close path, including on errors mid-analysis
+        with doc:
+            num_pages = len(doc)
+            result['num_pages'] = num_pages
+
+            if num_pages == 0:
+                return result
+
+            # Analyze first page
+            page = doc[0]
+            result['page_dimensions'] = (page.rect.width, page.rect.height)
+
+            # Check for text layer: sum text-block lengths instead of
+            # building (and stripping) the full page text
+            blocks = page.get_text("blocks")  # (x0, y0, x1, y1, text, block_no, block_type)
+            char_count = sum(len(b[4].strip()) for b in blocks if b[6] == 0)
+
+            if char_count < 50:
+                result['is_scanned'] = True
+                result['has_text_layer'] = False
+                return result
+
+            # Count words in left vs right half over first/middle/last pages so a
+            # single-column cover page doesn't decide the layout for the document
+            sample_idxs = [0] if num_pages < 3 else [0, num_pages // 2, num_pages - 1]
+            word_count = left_count = 0
+            for idx in sample_idxs:
+                sample = doc[idx]
+                words = sample.get_text("words")
+                mid_x = sample.rect.width / 2
+                xs = np.fromiter((w[0] for w in words), dtype=np.float32, count=len(words))
+                left_count += int((xs < mid_x).sum())
+                word_count += len(words)
+            result['word_count'] = word_count
+            result['left_count'] = left_count
+            result['right_count'] = word_count - left_count
+
+    except Exception as e:
+        result['error'] = str(e)
+
+    return result
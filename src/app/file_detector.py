@@ -5,9 +5,23 @@ File Type Detection
 Detect resume file types (PDF, DOCX, images) and their characteristics.
 """
 
-from pathlib import Path
+import os
 from typing import Dict, Any, Optional
-import fitz  # PyMuPDF
+
+from ._pdf_analysis import analyze_pdf
+
+
+# File extension -> file type
+_EXT_TO_TYPE = {
+    '.pdf': 'pdf',
+    '.docx': 'docx',
+    '.doc': 'docx',
+    '.jpg': 'image',
+    '.jpeg': 'image',
+    '.png': 'image',
+    '.tiff': 'image',
+    '.bmp': 'image',
+}
 
 
 class FileDetector:
@@ -35,15 +49,18 @@ class FileDetector:
         """
         file_type = detect_file_type(file_path)
         
+        # Analyze PDFs once and share the result with the helpers below
+        chars = analyze_pdf_characteristics(file_path) if file_type == 'pdf' else None
+        
         result = {
             'type': file_type,
-            'should_use_ocr': should_use_ocr(file_path),
-            'recommended_strategy': get_recommended_strategy(file_path)
+            'should_use_ocr': should_use_ocr(file_path, chars),
+            'recommended_strategy': get_recommended_strategy(file_path, chars)
         }
         
         # Add PDF characteristics if it's a PDF
-        if file_type == 'pdf':
-            result['characteristics'] = analyze_pdf_characteristics(file_path)
+        if chars is not None:
+            result['characteristics'] = chars
         
         return result
 
@@ -58,16 +75,7 @@ def detect_file_type(file_path: str) -> str:
     Returns:
         File type: 'pdf', 'docx', 'image', or 'unknown'
     """
-    suffix = Path(file_path).suffix.lower()
-    
-    if suffix == '.pdf':
-        return 'pdf'
-    elif suffix in ['.docx', '.doc']:
-        return 'docx'
-    elif suffix in ['.jpg', '.jpeg', '.png', '.tiff', '.bmp']:
-        return 'image'
-    else:
-        return 'unknown'
+    return _EXT_TO_TYPE.get(os.path.splitext(file_path)[1].lower(), 'unknown')
 
 
 def analyze_pdf_characteristics(pdf_path: str) -> Dict[str, Any]:
@@ -83,74 +91,45 @@ def analyze_pdf_characteristics(pdf_path: str) -> Dict[str, Any]:
         - estimated_columns: int
         - page_dimensions: tuple
     """
-    pdf_path = str(Path(pdf_path).resolve())
+    analysis = analyze_pdf(pdf_path)
     
     result = {
-        'is_scanned': False,
-        'has_text_layer': True,
-        'num_pages': 0,
+        'is_scanned': analysis['is_scanned'],
+        'has_text_layer': analysis['has_text_layer'],
+        'num_pages': analysis['num_pages'],
         'is_multi_column': False,
         'estimated_columns': 1,
-        'page_dimensions': (0, 0),
+        'page_dimensions': analysis['page_dimensions'],
         'confidence': 0.5
     }
     
-    try:
-        doc = fitz.open(pdf_path)
-        result['num_pages'] = len(doc)
-        
-        if len(doc) == 0:
-            doc.close()
-            return result
-        
-        # Analyze first page
-        page = doc[0]
-        result['page_dimensions'] = (page.rect.width, page.rect.height)
-        
-        # Check for text layer
-        text = page.get_text().strip()
-        
-        if len(text) < 50:
-            result['is_scanned'] = True
-            result['has_text_layer'] = False
-            doc.close()
-            return result
-        
-        result['has_text_layer'] = True
-        
-        # Check for multi-column layout
-        words = page.get_text("words")
-        
-        if len(words) > 20:
-            page_width = page.rect.width
-            mid_x = page_width / 2
-            
-            # Count words in left vs right half
-            left_count = sum(1 for w in words if w[0] < mid_x)
-            right_count = sum(1 for w in words if w[0] >= mid_x)
-            
-            # If both halves have substantial content, likely 2-column
-            if left_count > 10 and right_count > 10:
-                ratio = min(left_count, right_count) / max(left_count, right_count)
-                if ratio > 0.3:  # At least 30% balance
-                    result['is_multi_column'] = True
-                    result['estimated_columns'] = 2
-                    result['confidence'] = 0.7
-        
-        doc.close()
+    if 'error' in analysis:
+        result['error'] = analysis['error']
+        return result
+    
+    # Check for multi-column layout
+    if analysis['word_count'] > 20:
+        left_count = analysis['left_count']
+        right_count = analysis['right_count']
         
-    except Exception as e:
-        result['error'] = str(e)
+        # If both halves have substantial content, likely 2-column
+        if left_count > 10 and right_count > 10:
+            ratio = min(left_count, right_count) / max(left_count, right_count)
+            if ratio > 0.3:  # At least 30% balance
+                result['is_multi_column'] = True
+                result['estimated_columns'] = 2
+                result['confidence'] = 0.7
     
     return result
 
 
-def should_use_ocr(file_path: str) -> bool:
+def should_use_ocr(file_path: str, chars: Optional[Dict[str, Any]] = None) -> bool:
     """
     Determine if OCR should be used for this file.
     
     Args:
         file_path: Path to file
+        chars: Pre-computed analyze_pdf_characteristics result (optional)
         
     Returns:
         True if OCR recommended
@@ -163,19 +142,21 @@ def should_use_ocr(file_path: str) -> bool:
     
     # Check if PDF is scanned
     if file_type == 'pdf':
-        chars = analyze_pdf_characteristics(file_path)
+        if chars is None:
+            chars = analyze_pdf_characteristics(file_path)
         return chars.get('is_scanned', False)
     
     # DOCX files don't need OCR
     return False
 
 
-def get_recommended_strategy(file_path: str) -> str:
+def get_recommended_strategy(file_path: str, chars: Optional[Dict[str, Any]] = None) -> str:
     """
     Get recommended parsing strategy based on file analysis.
     
     Args:
         file_path: Path to file
+        chars: Pre-computed analyze_pdf_characteristics result (optional)
         
     Returns:
         Strategy name: 'pdf', 'ocr', 'docx', 'region', or 'unknown'
@@ -192,7 +173,8 @@ def get_recommended_strategy(file_path: str) -> str:
         return 'ocr'
     
     if file_type == 'pdf':
-        chars = analyze_pdf_characteristics(file_path)
+        if chars is None:
+            chars = analyze_pdf_characteristics(file_path)
         
         # Scanned PDFs need OCR
         if chars.get('is_scanned', False):
@@ -5,9 +5,9 @@ Layout Analyzer
 Analyzes PDF layout characteristics for intelligent parsing.
 """
 
-from pathlib import Path
 from typing import Dict, Any
-import fitz  # PyMuPDF
+
+from ._pdf_analysis import analyze_pdf
 
 
 class LayoutAnalyzer:
@@ -46,59 +46,44 @@ class LayoutAnalyzer:
             'confidence': 0.5
         }
         
-        try:
-            doc = fitz.open(str(Path(pdf_path).resolve()))
-            result['num_pages'] = len(doc)
-            
-            if len(doc) == 0:
-                doc.close()
-                return result
-            
-            # Analyze first page
-            page = doc[0]
-            
-            # Check for text layer
-            text = page.get_text().strip()
-            
-            if len(text) < 50:
-                result['is_scanned'] = True
-                result['has_text_layer'] = False
-                result['confidence'] = 0.9
-                doc.close()
-                return result
-            
-            result['has_text_layer'] = True
-            
-            # Analyze column layout
-            words = page.get_text("words")
+        analysis = analyze_pdf(pdf_path)
+        result['num_pages'] = analysis['num_pages']
+        
+        if 'error' in analysis:
+            result['error'] = analysis['error']
+            result['confidence'] = 0.0
+            return result
+        
+        if analysis['num_pages'] == 0:
+            return result
+        
+        # Check for text layer
+        if analysis['is_scanned']:
+            result['is_scanned'] = True
+            result['has_text_layer'] = False
+            result['confidence'] = 0.9
+            return result
+        
+        result['has_text_layer'] = True
+        
+        # Analyze column layout
+        if analysis['word_count'] > 20:
+            left_count = analysis['left_count']
+            right_count = analysis['right_count']
             
-            if len(words) > 20:
-                page_width = page.rect.width
-                mid_x = page_width / 2
-                
-                # Count words in left vs right half
-                left_count = sum(1 for w in words if w[0] < mid_x)
-                right_count = sum(1 for w in words if w[0] >= mid_x)
-                
-                # Check for multi-column layout
-                if left_count > 10 and right_count > 10:
-                    ratio = min(left_count, right_count) / max(left_count, right_count)
-                    if ratio > 0.3:  # At least 30% balance
-                        result['num_columns'] = 2
-                        result['num_regions'] = 2
-                        result['type'] = 'multi'
-                        result['confidence'] = 0.8
-                    else:
-                        result['type'] = 'single'
-                        result['confidence'] = 0.7
+            # Check for multi-column layout
+            if left_count > 10 and right_count > 10:
+                ratio = min(left_count, right_count) / max(left_count, right_count)
+                if ratio > 0.3:  # At least 30% balance
+                    result['num_columns'] = 2
+                    result['num_regions'] = 2
+                    result['type'] = 'multi'
+                    result['confidence'] = 0.8
                 else:
                     result['type'] = 'single'
-                    result['confidence'] = 0.9
-            
-            doc.close()
-            
-        except Exception as e:
-            result['error'] = str(e)
-            result['confidence'] = 0.0
+                    result['confidence'] = 0.7
+            else:
+                result['type'] = 'single'
+                result['confidence'] = 0.9
         
         return result
@@ -49,12 +49,7 @@ class QualityValidator:
         result['num_sections'] = len(sections)
         
         # Count total lines
-        total_lines = 0
-        for section in sections:
-            lines = section.get('lines', [])
-            total_lines += len(lines)
-        
-        result['total_lines'] = total_lines
+        result['total_lines'] = sum(map(len, (s.get('lines', ()) for s in sections)))
         
         # Check for contact info
         contact = data.get('contact', {})
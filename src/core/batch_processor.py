@@ -6,26 +6,362 @@ Process multiple resumes in parallel with progress tracking,
 error handling, and automatic result aggregation.
 """
 
+import hashlib
+import os
+import queue
+import threading
 import time
 import json
-import re
+from fnmatch import fnmatchcase
+from itertools import chain, islice
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Iterable, Iterator, Optional
+from concurrent.futures import (
+    Executor, ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+)
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import closing, nullcontext
 from dataclasses import dataclass
 from tqdm import tqdm
 
 try:
     from openpyxl import Workbook
     from openpyxl.styles import Font, PatternFill, Alignment
+    from openpyxl.utils import get_column_letter
     OPENPYXL_AVAILABLE = True
 except ImportError:
     OPENPYXL_AVAILABLE = False
 
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from src.core.unified_pipeline import UnifiedPipeline
 
-# Filter for Excel-unsafe characters
-ILLEGAL_CHARACTERS_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]')
+# Excel-unsafe control characters as a str.translate deletion table (one C-level pass per cell)
+ILLEGAL_CHARACTERS_TABLE = dict.fromkeys(
+    [*range(0x00, 0x09), 0x0b, 0x0c, *range(0x0e, 0x20), 0x7f]
+)
+
+# Tasks kept in flight per worker; bounds pending futures regardless of batch size
+SUBMIT_WINDOW_PER_WORKER = 4
+
+# Upper bound on files sent to a worker process per task (amortizes IPC)
+MAX_TASK_CHUNK = 8
+
+# Bump when pipeline output changes so stale cached parses are not reused
+PARSE_CACHE_VERSION = 1
+
+# Per-process pipeline for ProcessPoolExecutor workers (built once by _init_worker)
+_WORKER_PIPELINE: Optional[UnifiedPipeline] = None
+_WORKER_CACHE_DIR: Optional[str] = None
+
+
+def _init_worker(config_path: Optional[str], enable_learning: bool, cache_dir: Optional[str] = None):
+    """Build one UnifiedPipeline per worker process."""
+    global _WORKER_PIPELINE, _WORKER_CACHE_DIR
+    _WORKER_PIPELINE = UnifiedPipeline(
+        config_path=config_path,
+        enable_learning=enable_learning,
+        verbose=False
+    )
+    _WORKER_CACHE_DIR = cache_dir
+
+
+def _process_single_worker(file_path: str) -> Dict[str, Any]:
+    """Process a single file in a worker process."""
+    return _parse_cached(_WORKER_PIPELINE, file_path, _WORKER_CACHE_DIR)
+
+
+def _run_chunk(task, file_paths: List[str]) -> List[tuple]:
+    """
+    Run task over a chunk of files in one pool task, returning a
+    (result, exception) pair per file so one failure doesn't sink the chunk.
+    """
+    outcomes = []
+    for file_path in file_paths:
+        try:
+            outcomes.append((task(file_path), None))
+        except Exception as e:
+            outcomes.append((None, e))
+    return outcomes
+
+
+def _parse_cached(
+    pipeline: UnifiedPipeline,
+    file_path: str,
+    cache_dir: Optional[str]
+) -> Dict[str, Any]:
+    """
+    Parse file_path, reusing an earlier result for identical file content.
+    
+    Successful results are stored in cache_dir as <sha256>-v<version>.json
+    (written to a temp file and renamed, so concurrent workers never see a
+    partial entry). Without a cache_dir this is just pipeline.parse.
+    """
+    if cache_dir is None:
+        return pipeline.parse(file_path)
+    
+    try:
+        with open(file_path, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return pipeline.parse(file_path)
+    
+    cache_file = os.path.join(cache_dir, f"{digest}-v{PARSE_CACHE_VERSION}.json")
+    try:
+        with open(cache_file, 'rb') as f:
+            result = _loads_json(f.read())
+    except (OSError, ValueError):
+        result = None
+    
+    if result is not None:
+        # The same content may have been cached under another file name
+        result['metadata']['file_path'] = str(file_path)
+        result['metadata']['file_name'] = os.path.basename(file_path)
+        return result
+    
+    result = pipeline.parse(file_path)
+    if result.get('success'):
+        tmp_file = f"{cache_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(_dumps_json(result, indent=False))
+            os.replace(tmp_file, cache_file)
+        except (OSError, TypeError, ValueError):
+            # Caching is best effort; the parse result is still returned
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+    return result
+
+
+def _dumps_json(obj: Any, indent: bool = True) -> bytes:
+    """Serialize to UTF-8 JSON, indented by default (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode('utf-8')
+
+
+def _loads_json(data: bytes) -> Any:
+    """Parse UTF-8 JSON (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _iter_files(directory: str, pattern: str) -> Iterator[str]:
+    """
+    Lazily yield files in directory whose name matches pattern.
+    
+    Uses os.scandir so entries are produced as the directory is read rather
+    than after a full listing. A leading "**/" in pattern searches
+    subdirectories too (without following directory symlinks), like
+    Path.glob; other multi-component patterns are delegated to Path.glob.
+    """
+    recursive = pattern.startswith('**/')
+    if recursive:
+        pattern = pattern[3:]
+    
+    if '/' in pattern or os.sep in pattern:
+        full_pattern = f"**/{pattern}" if recursive else pattern
+        yield from (str(p) for p in Path(directory).glob(full_pattern) if p.is_file())
+        return
+    
+    pending = [directory]
+    while pending:
+        try:
+            it = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                # Name test first: pure string work. The is_* checks use the
+                # d_type from the directory listing, so no per-entry stat
+                if fnmatchcase(entry.name, pattern) and entry.is_file():
+                    yield entry.path
+                elif recursive and entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+
+
+class _IndividualResultWriter:
+    """
+    Writes each successful result to <output_dir>/<stem>.json on a
+    background thread, so file I/O overlaps with parsing.
+    
+    Results are handed over through a bounded queue; closing the writer
+    (or leaving its `with` block) drains the queue and joins the thread.
+    With output_path=None every call is a no-op. Each file is serialized
+    in memory and written with a single write call (no fsync).
+    """
+    
+    def __init__(self, output_path: Optional[Path], maxsize: int = 0, indent: bool = True):
+        self.output_path = output_path
+        self.indent = indent
+        self._error: Optional[BaseException] = None
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        
+        if output_path is not None:
+            self._queue = queue.Queue(maxsize=maxsize)
+            self._thread = threading.Thread(
+                target=self._run, name="batch-json-writer", daemon=True
+            )
+            self._thread.start()
+    
+    def put(self, stem: str, payload: Dict[str, Any]):
+        """Queue one parsed result for writing to <stem>.json."""
+        if self._queue is not None:
+            self._queue.put((stem, payload))
+    
+    def close(self):
+        """Flush pending writes and stop the thread; re-raise any write error."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        if self._error is not None:
+            raise self._error
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            if self._error is not None:
+                continue  # Keep draining so producers never block
+            try:
+                stem, payload = item
+                individual_path = self.output_path / f"{stem}.json"
+                individual_path.write_bytes(_dumps_json(payload, indent=self.indent))
+            except Exception as e:
+                self._error = e
+
+
+class _ExcelResultWriter:
+    """
+    Builds Excel rows for successful results on a background thread while
+    the batch is still parsing, and writes the workbook on close().
+    
+    Section columns are numbered in order of first appearance, so each row
+    can be built as soon as its result arrives; only the header has to wait
+    for the full column set. With output_path=None every call is a no-op.
+    """
+    
+    def __init__(self, processor: "BatchProcessor", output_path: Optional[str], maxsize: int = 0):
+        self.output_path = output_path
+        self._processor = processor
+        self._section_index: Dict[str, int] = {}
+        self._rows: List[List[Any]] = []
+        self._error: Optional[BaseException] = None
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        
+        if output_path is not None:
+            self._queue = queue.Queue(maxsize=maxsize)
+            self._thread = threading.Thread(
+                target=self._run, name="batch-excel-writer", daemon=True
+            )
+            self._thread.start()
+    
+    def put(self, result: Dict[str, Any]):
+        """Queue one successful result for its Excel row."""
+        if self._queue is not None:
+            self._queue.put(result)
+    
+    def close(self, write: bool = True):
+        """Build the remaining rows and write the workbook (if any rows)."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        if self._error is not None:
+            raise self._error
+        if write and self._rows:
+            self._processor._write_excel(
+                self.output_path, self._section_index, self._rows, include_sections=True
+            )
+        self._rows = []
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        # Don't leave a partial workbook behind for an abandoned batch
+        self.close(write=exc_type is None)
+    
+    def _run(self):
+        build_row = self._processor._excel_row
+        while True:
+            result = self._queue.get()
+            if result is None:
+                return
+            if self._error is not None:
+                continue  # Keep draining so producers never block
+            try:
+                self._rows.append(build_row(result, self._section_index, True, grow=True))
+            except Exception as e:
+                self._error = e
+
+
+@dataclass(slots=True)
+class ParseResult:
+    """
+    Flattened view of one successful pipeline result.
+    
+    Built once when the task completes so the summary and output paths read
+    attributes instead of re-walking the nested result dicts.
+    """
+    file_name: str
+    stem: str
+    strategy: str
+    n_sections: int
+    n_lines: int
+    processing_time: float
+    
+    @classmethod
+    def from_pipeline(cls, result: Dict[str, Any]) -> "ParseResult":
+        """Build from a UnifiedPipeline.parse() result."""
+        file_name = result['metadata']['file_name']
+        # `or ()` also covers keys present with a None value
+        sections = result['result'].get('sections') or ()
+        return cls(
+            file_name=file_name,
+            stem=os.path.splitext(os.path.basename(file_name))[0],
+            strategy=result['strategy'],
+            n_sections=len(sections),
+            n_lines=sum(len(s.get('lines') or ()) for s in sections),
+            processing_time=result['metadata']['processing_time']
+        )
+    
+    def summary_dict(self) -> Dict[str, Any]:
+        """Per-result record stored in batch_summary.json."""
+        return {
+            'file': self.file_name,
+            'sections': self.n_sections,
+            'lines': self.n_lines,
+            'strategy': self.strategy,
+            'processing_time': self.processing_time
+        }
 
 
 @dataclass
@@ -38,11 +374,27 @@ class BatchResult:
     errors: List[Dict[str, str]]
     processing_time: float
     avg_time_per_file: float
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Dictionary form returned by BatchProcessor.process_batch."""
+        return {
+            'total_processed': self.total,
+            'successful': self.successful,
+            'failed': self.failed,
+            'results': self.results,
+            'errors': self.errors,
+            'total_time': self.processing_time,
+            'avg_time': self.avg_time_per_file
+        }
 
 
 class BatchProcessor:
     """
     Process multiple resumes in parallel.
+    
+    The worker pool is kept between batches so workers (and their
+    pipelines) stay warm; use the processor as a context manager or call
+    close() to shut it down.
     """
     
     def __init__(
@@ -50,7 +402,10 @@ class BatchProcessor:
         config_path: Optional[str] = None,
         max_workers: int = 4,
         enable_learning: bool = True,
-        verbose: bool = False
+        verbose: bool = False,
+        use_processes: bool = True,
+        cache_dir: Optional[str] = None,
+        compact_json: bool = False
     ):
         """
         Initialize batch processor.
@@ -60,27 +415,66 @@ class BatchProcessor:
             max_workers: Number of parallel workers
             enable_learning: Enable section learning
             verbose: Print detailed progress
+            use_processes: Parse in worker processes (one pipeline each) so
+                CPU-bound parsing is not serialized on the GIL. Set False to
+                use threads instead, each with its own pipeline (e.g. where
+                spawning processes is not possible).
+            cache_dir: Directory for a content-addressed cache of parse
+                results; files already parsed (by content) are not parsed
+                again. Use a separate directory per sections config.
+                None disables caching.
+            compact_json: Write individual result files without
+                indentation (smaller and faster to write)
         """
         self.max_workers = max_workers
         self.verbose = verbose
         self.enable_learning = enable_learning
+        self.config_path = config_path
+        self.use_processes = use_processes
+        self.compact_json = compact_json
         
-        # Initialize pipeline
-        self.pipeline = UnifiedPipeline(
-            config_path=config_path,
-            enable_learning=enable_learning,
-            verbose=False  # Disable verbose for parallel processing
-        )
+        self.cache_dir: Optional[str] = None
+        if cache_dir:
+            cache_path = Path(cache_dir).expanduser()
+            cache_path.mkdir(parents=True, exist_ok=True)
+            self.cache_dir = str(cache_path)
+        
+        # Worker processes build their own pipeline; in thread mode each
+        # worker thread lazily builds one here so threads never share state
+        self._pipeline_local = threading.local()
+        
+        # Worker pool kept across batches (created on first use, see close())
+        self._executor: Optional[Executor] = None
+        self._executor_workers = 0
         
         if self.verbose:
             print(f"[Batch Processor] Initialized with {max_workers} workers")
     
+    def close(self):
+        """Shut down the worker pool. A later batch starts a new one."""
+        self._shutdown_executor()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def __del__(self):
+        try:
+            self._shutdown_executor(wait=False)
+        except Exception:
+            pass
+    
     def process_directory(
         self,
         directory: str,
         pattern: str = "*.pdf",
         output_dir: Optional[str] = None,
-        save_individual: bool = False
+        save_individual: bool = False,
+        stream_output: bool = False,
+        keep_payloads: bool = True,
+        collect_results: bool = True
     ) -> BatchResult:
         """
         Process all resumes in a directory.
@@ -90,16 +484,21 @@ class BatchProcessor:
             pattern: File pattern to match (e.g., "*.pdf", "*.docx")
             output_dir: Directory to save results
             save_individual: Save individual JSON files
+            stream_output: Write results to output_dir as they complete
+                instead of returning them (keeps memory flat for large batches)
+            keep_payloads: With save_individual, False drops each returned
+                result's parsed 'result' body once it is handed to the writer
+            collect_results: False returns only counts and errors
+                (BatchResult.results stays empty), e.g. for stats-only runs
             
         Returns:
             BatchResult object with statistics and results
         """
-        start_time = time.time()
-        
-        # Find all matching files
-        files = list(Path(directory).glob(pattern))
+        # Stream matching files; parsing starts as soon as the first is found
+        files = _iter_files(directory, pattern)
+        first = next(files, None)
         
-        if not files:
+        if first is None:
             if self.verbose:
                 print(f"No files matching '{pattern}' found in {directory}")
             
@@ -115,97 +514,28 @@ class BatchProcessor:
         
         if self.verbose:
             print(f"\n{'='*60}")
-            print(f"[Batch Processing] {len(files)} files")
-            print(f"{'='*60}\n")
-        
-        # Process files in parallel
-        results = []
-        errors = []
-        
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            future_to_file = {
-                executor.submit(self._process_single, str(f)): f
-                for f in files
-            }
-            
-            # Process completed tasks with progress bar
-            with tqdm(total=len(files), desc="Processing", disable=not self.verbose) as pbar:
-                for future in as_completed(future_to_file):
-                    file_path = future_to_file[future]
-                    
-                    try:
-                        result = future.result()
-                        
-                        if result['success']:
-                            results.append(result)
-                        else:
-                            errors.append({
-                                'file': str(file_path),
-                                'error': result['metadata'].get('error', 'Unknown error')
-                            })
-                    
-                    except Exception as e:
-                        errors.append({
-                            'file': str(file_path),
-                            'error': str(e)
-                        })
-                    
-                    pbar.update(1)
-        
-        # Save results if output directory specified
-        if output_dir and results:
-            output_path = Path(output_dir)
-            output_path.mkdir(parents=True, exist_ok=True)
-            
-            # Save aggregated results
-            summary_path = output_path / "batch_summary.json"
-            self._save_summary(results, errors, summary_path)
-            
-            # Save individual files if requested
-            if save_individual:
-                for result in results:
-                    file_name = Path(result['metadata']['file_name']).stem
-                    individual_path = output_path / f"{file_name}.json"
-                    
-                    with open(individual_path, 'w', encoding='utf-8') as f:
-                        json.dump(result['result'], f, ensure_ascii=False, indent=2)
-            
-            if self.verbose:
-                print(f"\n[Saved] Results to: {output_dir}")
-        
-        # Calculate statistics
-        processing_time = time.time() - start_time
-        successful = len(results)
-        failed = len(errors)
-        total = len(files)
-        avg_time = processing_time / total if total > 0 else 0.0
-        
-        if self.verbose:
-            print(f"\n{'='*60}")
-            print(f"[Batch Complete]")
-            print(f"  Total: {total}")
-            print(f"  Success: {successful} ({successful/total*100:.1f}%)")
-            print(f"  Failed: {failed} ({failed/total*100:.1f}%)")
-            print(f"  Time: {processing_time:.2f}s")
-            print(f"  Avg: {avg_time:.2f}s/file")
+            print(f"[Batch Processing] {os.path.join(directory, pattern)}")
             print(f"{'='*60}\n")
         
-        return BatchResult(
-            total=total,
-            successful=successful,
-            failed=failed,
-            results=results,
-            errors=errors,
-            processing_time=processing_time,
-            avg_time_per_file=avg_time
+        return self._run_batch(
+            chain((first,), files),
+            workers=self.max_workers,
+            output_dir=output_dir,
+            save_individual=save_individual,
+            verbose=self.verbose,
+            stream_output=stream_output,
+            keep_payloads=keep_payloads,
+            collect_results=collect_results
         )
     
     def process_files(
         self,
         file_paths: List[str],
         output_dir: Optional[str] = None,
-        save_individual: bool = False
+        save_individual: bool = False,
+        stream_output: bool = False,
+        keep_payloads: bool = True,
+        collect_results: bool = True
     ) -> BatchResult:
         """
         Process a list of specific files.
@@ -214,88 +544,31 @@ class BatchProcessor:
             file_paths: List of file paths to process
             output_dir: Directory to save results
             save_individual: Save individual JSON files
+            stream_output: Write results to output_dir as they complete
+                instead of returning them (keeps memory flat for large batches)
+            keep_payloads: With save_individual, False drops each returned
+                result's parsed 'result' body once it is handed to the writer
+            collect_results: False returns only counts and errors
+                (BatchResult.results stays empty), e.g. for stats-only runs
             
         Returns:
             BatchResult object
         """
-        start_time = time.time()
-        
         if self.verbose:
             print(f"\n{'='*60}")
             print(f"[Batch Processing] {len(file_paths)} files")
             print(f"{'='*60}\n")
         
-        results = []
-        errors = []
-        
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_file = {
-                executor.submit(self._process_single, f): f
-                for f in file_paths
-            }
-            
-            with tqdm(total=len(file_paths), desc="Processing", disable=not self.verbose) as pbar:
-                for future in as_completed(future_to_file):
-                    file_path = future_to_file[future]
-                    
-                    try:
-                        result = future.result()
-                        
-                        if result['success']:
-                            results.append(result)
-                        else:
-                            errors.append({
-                                'file': file_path,
-                                'error': result['metadata'].get('error', 'Unknown error')
-                            })
-                    
-                    except Exception as e:
-                        errors.append({
-                            'file': file_path,
-                            'error': str(e)
-                        })
-                    
-                    pbar.update(1)
-        
-        # Save results if requested
-        if output_dir and results:
-            output_path = Path(output_dir)
-            output_path.mkdir(parents=True, exist_ok=True)
-            
-            summary_path = output_path / "batch_summary.json"
-            self._save_summary(results, errors, summary_path)
-            
-            if save_individual:
-                for result in results:
-                    file_name = Path(result['metadata']['file_name']).stem
-                    individual_path = output_path / f"{file_name}.json"
-                    
-                    with open(individual_path, 'w', encoding='utf-8') as f:
-                        json.dump(result['result'], f, ensure_ascii=False, indent=2)
-        
-        processing_time = time.time() - start_time
-        successful = len(results)
-        failed = len(errors)
-        total = len(file_paths)
-        avg_time = processing_time / total if total > 0 else 0.0
-        
-        if self.verbose:
-            print(f"\n{'='*60}")
-            print(f"[Batch Complete]")
-            print(f"  Success: {successful}/{total}")
-            print(f"  Failed: {failed}/{total}")
-            print(f"  Time: {processing_time:.2f}s")
-            print(f"  Avg: {avg_time:.2f}s/file")
-            print(f"{'='*60}\n")
-        
-        return BatchResult(
-            total=total,
-            successful=successful,
-            failed=failed,
-            results=results,
-            errors=errors,
-            processing_time=processing_time,
-            avg_time_per_file=avg_time
+        return self._run_batch(
+            file_paths,
+            workers=self.max_workers,
+            total=len(file_paths),
+            output_dir=output_dir,
+            save_individual=save_individual,
+            verbose=self.verbose,
+            stream_output=stream_output,
+            keep_payloads=keep_payloads,
+            collect_results=collect_results
         )
     
     def process_batch(
@@ -322,7 +595,7 @@ class BatchProcessor:
                 - results: List[Dict]
                 - total_time: float
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         if max_workers:
             workers = max_workers
@@ -332,99 +605,346 @@ class BatchProcessor:
         if verbose:
             print(f"\nProcessing {len(input_paths)} files with {workers} workers...")
         
-        results = []
-        errors = []
+        # Excel rows are built while parsing; the workbook is written when
+        # the batch finishes
+        batch = self._run_batch(
+            input_paths,
+            workers=workers,
+            total=len(input_paths),
+            verbose=verbose,
+            excel_output=output_excel
+        )
+        
+        # Reported time includes the Excel export
+        batch.processing_time = time.perf_counter() - start_time
+        batch.avg_time_per_file = batch.processing_time / batch.total if batch.total else 0
+        
+        return batch.as_dict()
+    
+    def _run_batch(
+        self,
+        paths: Iterable,
+        workers: int,
+        total: Optional[int] = None,
+        output_dir: Optional[str] = None,
+        save_individual: bool = False,
+        verbose: bool = False,
+        stream_output: bool = False,
+        keep_payloads: bool = True,
+        collect_results: bool = True,
+        excel_output: Optional[str] = None
+    ) -> BatchResult:
+        """
+        Parse paths on the worker pool and collect results.
+        
+        Shared by all process_* entry points: owns the executor, the
+        submission window, progress bar, error collection and output files.
         
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            future_to_file = {
-                executor.submit(self._process_single, path): path
-                for path in input_paths
-            }
+        Args:
+            paths: Iterable of file paths (may be a lazy generator)
+            workers: Number of parallel workers
+            total: Number of paths, if known (for the progress bar)
+            output_dir: Directory to save results
+            save_individual: Save individual JSON files
+            verbose: Show progress bar and final statistics
+            stream_output: Write each successful result to output_dir as
+                it completes and keep only its summary entry in memory
+                (BatchResult.results is then empty)
+            keep_payloads: If False and results are saved individually, set
+                each returned result's 'result' to None after queuing it for
+                writing; the body is freed as soon as its file is written
+            collect_results: If False, results are counted (and written when
+                requested) but not returned
+            excel_output: Excel file to write successful results to; rows
+                are built on a background thread as results arrive
             
-            for future in as_completed(future_to_file):
-                file_path = future_to_file[future]
-                
-                try:
-                    result = future.result()
+        Returns:
+            BatchResult object
+        """
+        if stream_output and not output_dir:
+            raise ValueError("stream_output requires output_dir")
+        
+        start_time = time.perf_counter()
+        
+        # Pre-size to the batch when its length is known; unused slots are
+        # trimmed after the loop (unknown-length batches just append)
+        slots = total or 0
+        collect = collect_results and not stream_output
+        results: List[Optional[Dict[str, Any]]] = [None] * (slots if collect else 0)
+        parsed: List[ParseResult] = []  # Summary entries, kept only when writing output
+        errors: List[Optional[Dict[str, str]]] = [None] * slots
+        n_results = n_errors = n_successful = 0
+        writer = self._start_individual_writer(output_dir, save_individual or stream_output)
+        drop_payloads = not keep_payloads and writer.output_path is not None
+        excel = self._start_excel_writer(excel_output)
+        
+        # Refresh the bar at most every 0.5s / 0.5% of the batch, and hand it
+        # completions in chunks so large batches don't pay per-file bar updates
+        miniters = max(1, (total or 0) // 200)
+        pending_updates = 0
+        
+        executor = self._get_executor(workers)
+        pool_broken = False
+        
+        # Worker processes get several files per task on large batches; threads
+        # have no IPC to amortize, so they keep one file per task
+        chunksize = 1
+        if self.use_processes and total:
+            chunksize = min(MAX_TASK_CHUNK, max(1, total // (workers * SUBMIT_WINDOW_PER_WORKER * 4)))
+        completed = self._iter_completed(executor, paths, workers, chunksize)
+        
+        # Quiet runs get no progress bar object at all (pbar is None)
+        progress = tqdm(
+            total=total,
+            desc="Processing",
+            mininterval=0.5,
+            miniters=miniters,
+            smoothing=0.1
+        ) if verbose else nullcontext()
+        
+        try:
+            # closing() cancels still-queued tasks if the batch is abandoned, so
+            # they don't occupy the shared pool during the next batch
+            with writer, excel, closing(completed):
+                with progress as pbar:
+                    for file_path, result, exc in completed:
+                        error = None
+                        try:
+                            if exc is not None:
+                                raise exc
+                        
+                            if result['success']:
+                                n_successful += 1
+                                if output_dir:
+                                    record = ParseResult.from_pipeline(result)
+                                    parsed.append(record)
+                                    writer.put(record.stem, result['result'])
+                                excel.put(result)
+                                if collect:
+                                    if drop_payloads:
+                                        # The writer holds the only remaining reference
+                                        result['result'] = None
+                                    if n_results < slots:
+                                        results[n_results] = result
+                                    else:
+                                        results.append(result)
+                                    n_results += 1
+                            else:
+                                error = result['metadata'].get('error', 'Unknown error')
+                        
+                        except BrokenProcessPool as e:
+                            pool_broken = True
+                            error = str(e)
+                        except Exception as e:
+                            error = str(e)
+                        
+                        if error is not None:
+                            entry = {'file': str(file_path), 'error': error}
+                            if n_errors < slots:
+                                errors[n_errors] = entry
+                            else:
+                                errors.append(entry)
+                            n_errors += 1
+                        
+                        if pbar is not None:
+                            pending_updates += 1
+                            if pending_updates >= miniters:
+                                pbar.update(pending_updates)
+                                pending_updates = 0
                     
-                    if result['success']:
-                        results.append(result)
-                    else:
-                        errors.append({
-                            'file': file_path,
-                            'error': result['metadata'].get('error', 'Unknown')
-                        })
-                
-                except Exception as e:
-                    errors.append({
-                        'file': file_path,
-                        'error': str(e)
-                    })
+                    if pending_updates:
+                        pbar.update(pending_updates)
         
-        # Save to Excel if requested
-        if output_excel and results:
-            self._save_to_excel(results, output_excel)
+        finally:
+            if pool_broken:
+                # A worker died; start a fresh pool for the next batch
+                self._shutdown_executor(wait=False)
         
-        total_time = time.time() - start_time
+        del results[n_results:]
+        del errors[n_errors:]
+        successful = n_successful
         
-        return {
-            'total_processed': len(input_paths),
-            'successful': len(results),
-            'failed': len(errors),
-            'results': results,
-            'errors': errors,
-            'total_time': total_time,
-            'avg_time': total_time / len(input_paths) if input_paths else 0
-        }
+        # Save aggregated results (individual files were written as results arrived)
+        if output_dir and successful:
+            output_path = Path(output_dir)
+            output_path.mkdir(parents=True, exist_ok=True)
+            
+            summary_path = output_path / "batch_summary.json"
+            self._save_summary(parsed, successful, errors, summary_path)
+            
+            if verbose:
+                print(f"\n[Saved] Results to: {output_dir}")
+        
+        # Calculate statistics
+        processing_time = time.perf_counter() - start_time
+        failed = len(errors)
+        total = successful + failed
+        avg_time = processing_time / total if total > 0 else 0.0
+        
+        if verbose and total:
+            print(f"\n{'='*60}")
+            print(f"[Batch Complete]")
+            print(f"  Total: {total}")
+            print(f"  Success: {successful} ({successful/total*100:.1f}%)")
+            print(f"  Failed: {failed} ({failed/total*100:.1f}%)")
+            print(f"  Time: {processing_time:.2f}s")
+            print(f"  Avg: {avg_time:.2f}s/file")
+            print(f"{'='*60}\n")
+        
+        return BatchResult(
+            total=total,
+            successful=successful,
+            failed=failed,
+            results=results,
+            errors=errors,
+            processing_time=processing_time,
+            avg_time_per_file=avg_time
+        )
     
     @staticmethod
     def _sanitize_cell(value: str) -> str:
         """Sanitize cell value for Excel compatibility."""
         if value is None:
             return ""
-        s = str(value)
-        s = ILLEGAL_CHARACTERS_RE.sub("", s)
-        return s.strip()
+        return str(value).translate(ILLEGAL_CHARACTERS_TABLE).strip()
     
-    def _save_to_excel(
+    def _write_excel(
         self,
-        results: List[Dict[str, Any]],
         output_path: str,
-        include_sections: bool = True
+        section_index: Dict[str, int],
+        rows: Iterable[List[Any]],
+        include_sections: bool
     ):
+        """Write the header (from section_index) and rows to output_path."""
+        # Build header row
+        headers = ['File Name', 'Success', 'Strategy', 'Processing Time (s)', 'Total Sections', 'Contact Info']
+        if include_sections:
+            headers.extend(section_index)
+        
+        if XLSXWRITER_AVAILABLE:
+            self._write_xlsx_streaming(output_path, headers, rows)
+        else:
+            self._write_xlsx_openpyxl(output_path, headers, rows)
+        
+        if self.verbose:
+            print(f"  Excel file saved: {output_path}")
+    
+    def _excel_row(
+        self,
+        result: Dict[str, Any],
+        section_index: Dict[str, int],
+        include_sections: bool,
+        grow: bool = False
+    ) -> List[Any]:
         """
-        Save results to Excel file with sections as columns.
+        Build one result's list of sanitized cell values.
         
-        Args:
-            results: List of processing results
-            output_path: Path to Excel file
-            include_sections: Include individual sections as columns
+        With grow=True, sections missing from section_index are appended to
+        it (new columns), so rows can be built before all results are known.
+        Such rows end at the last column known when they were built.
         """
-        if not OPENPYXL_AVAILABLE:
-            print("Warning: openpyxl not available. Install with: pip install openpyxl")
-            return
+        file_name = os.path.basename(result['metadata']['file_name'])
+        success = result.get('success', False)
+        strategy = result.get('strategy', 'unknown')
+        proc_time = result['metadata'].get('processing_time', 0)
         
-        # Create workbook
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Resume Data"
+        # Basic columns
+        row = [
+            self._sanitize_cell(file_name),
+            '✓' if success else '✗',
+            self._sanitize_cell(strategy),
+            round(proc_time, 2),
+        ]
         
-        # Define all potential section names from results
-        all_sections = set()
-        for result in results:
-            if result.get('success') and result.get('result'):
-                sections = result['result'].get('sections', [])
+        if success and result.get('result'):
+            data = result['result']
+            sections = data.get('sections', [])
+            
+            # Total sections count
+            row.append(len(sections))
+            
+            # Contact info (as JSON string)
+            contact = data.get('contact')
+            contact_str = _dumps_json(contact, indent=False).decode('utf-8') if contact else ''
+            row.append(self._sanitize_cell(contact_str))
+            
+            if include_sections:
+                if grow:
+                    for section in sections:
+                        section_index.setdefault(section.get('section', 'Unknown'), len(section_index))
+                
+                # Write each section's joined lines straight into its column
+                section_values = [''] * len(section_index)
                 for section in sections:
-                    section_name = section.get('section', 'Unknown')
-                    all_sections.add(section_name)
+                    idx = section_index.get(section.get('section', 'Unknown'))
+                    if idx is not None:
+                        lines = section.get('lines') or ()
+                        section_values[idx] = self._sanitize_cell(
+                            '\n'.join(map(str, filter(None, lines)))
+                        )
+                row.extend(section_values)
+        else:
+            # Failed processing
+            row.append(0)
+            error_msg = result['metadata'].get('error', 'Unknown error')
+            row.append(self._sanitize_cell(f"Error: {error_msg}"))
+        
+        return row
+    
+    @staticmethod
+    def _update_column_widths(widths: List[int], row: List[Any]):
+        """Raise widths[i] to the display length of row[i] where it is longer."""
+        for col_idx, value in enumerate(row):
+            if value:
+                length = len(str(value))
+                if col_idx >= len(widths):
+                    widths.append(length)
+                elif length > widths[col_idx]:
+                    widths[col_idx] = length
+    
+    @staticmethod
+    def _write_xlsx_streaming(output_path: str, headers: List[str], rows: Iterable[List[Any]]):
+        """Write rows with xlsxwriter; each row is flushed to disk once written."""
+        wb = xlsxwriter.Workbook(output_path, {
+            'constant_memory': True,
+            'strings_to_formulas': False,
+            'strings_to_urls': False,
+        })
+        ws = wb.add_worksheet("Resume Data")
         
-        # Sort sections for consistent column order
-        section_columns = sorted(all_sections)
+        # Style header
+        header_format = wb.add_format({
+            'bold': True,
+            'font_color': '#FFFFFF',
+            'bg_color': '#366092',
+            'align': 'center',
+            'valign': 'vcenter',
+        })
+        ws.write_row(0, 0, headers, header_format)
         
-        # Build header row
-        headers = ['File Name', 'Success', 'Strategy', 'Processing Time (s)', 'Total Sections', 'Contact Info']
-        if include_sections:
-            headers.extend(section_columns)
+        # Track the longest value per column while writing (rows can't be re-read)
+        widths = [len(h) for h in headers]
+        
+        for row_idx, row in enumerate(rows, 1):
+            ws.write_row(row_idx, 0, row)
+            BatchProcessor._update_column_widths(widths, row)
+        
+        # Set width (max 50 for readability)
+        for col_idx, max_length in enumerate(widths):
+            ws.set_column(col_idx, col_idx, min(max_length + 2, 50))
+        
+        # Freeze first row
+        ws.freeze_panes(1, 0)
+        
+        wb.close()
+    
+    @staticmethod
+    def _write_xlsx_openpyxl(output_path: str, headers: List[str], rows: Iterable[List[Any]]):
+        """Write rows with openpyxl (fallback when xlsxwriter is not installed)."""
+        # Create workbook
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Resume Data"
         
         # Style header
         header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
@@ -436,106 +956,211 @@ class BatchProcessor:
             cell.font = header_font
             cell.alignment = Alignment(horizontal='center', vertical='center')
         
-        # Add data rows
-        for row_idx, result in enumerate(results, 2):
-            file_name = Path(result['metadata']['file_name']).name
-            success = result.get('success', False)
-            strategy = result.get('strategy', 'unknown')
-            proc_time = result['metadata'].get('processing_time', 0)
-            
-            # Basic columns
-            ws.cell(row=row_idx, column=1, value=self._sanitize_cell(file_name))
-            ws.cell(row=row_idx, column=2, value='✓' if success else '✗')
-            ws.cell(row=row_idx, column=3, value=self._sanitize_cell(strategy))
-            ws.cell(row=row_idx, column=4, value=round(proc_time, 2))
-            
-            if success and result.get('result'):
-                data = result['result']
-                sections = data.get('sections', [])
-                
-                # Total sections count
-                ws.cell(row=row_idx, column=5, value=len(sections))
-                
-                # Contact info (as JSON string)
-                contact = data.get('contact', {})
-                contact_str = json.dumps(contact, ensure_ascii=False) if contact else ''
-                ws.cell(row=row_idx, column=6, value=self._sanitize_cell(contact_str))
-                
-                if include_sections:
-                    # Create a map of section name to content
-                    section_map = {}
-                    for section in sections:
-                        section_name = section.get('section', 'Unknown')
-                        lines = section.get('lines', [])
-                        # Join lines into single text
-                        content = '\n'.join(str(line) for line in lines if line)
-                        section_map[section_name] = content
-                    
-                    # Fill section columns
-                    for col_idx, section_name in enumerate(section_columns, 7):
-                        content = section_map.get(section_name, '')
-                        ws.cell(row=row_idx, column=col_idx, value=self._sanitize_cell(content))
-            else:
-                # Failed processing
-                ws.cell(row=row_idx, column=5, value=0)
-                error_msg = result['metadata'].get('error', 'Unknown error')
-                ws.cell(row=row_idx, column=6, value=self._sanitize_cell(f"Error: {error_msg}"))
-        
-        # Auto-adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            
-            for cell in column:
-                try:
-                    if cell.value:
-                        cell_length = len(str(cell.value))
-                        if cell_length > max_length:
-                            max_length = cell_length
-                except:
-                    pass
-            
-            # Set width (max 50 for readability)
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
+        # Track the longest value per column while appending, so the sheet
+        # is not walked a second time to size the columns
+        widths = [len(h) for h in headers]
+        
+        # Add data rows (one append per row instead of per-cell lookups)
+        for row in rows:
+            ws.append(row)
+            BatchProcessor._update_column_widths(widths, row)
+        
+        # Set width (max 50 for readability)
+        for col_idx, max_length in enumerate(widths, 1):
+            ws.column_dimensions[get_column_letter(col_idx)].width = min(max_length + 2, 50)
         
         # Freeze first row
         ws.freeze_panes = 'A2'
         
         # Save workbook
         wb.save(output_path)
+    
+    def _get_executor(self, max_workers: int) -> Executor:
+        """
+        Return the persistent worker pool, (re)creating it if none exists
+        yet or a different worker count is requested.
+        """
+        if self._executor is None or self._executor_workers != max_workers:
+            self._shutdown_executor()
+            self._executor = self._create_executor(max_workers)
+            self._executor_workers = max_workers
+        return self._executor
+    
+    def _shutdown_executor(self, wait: bool = True):
+        """Shut down the worker pool (if any), dropping tasks not yet started."""
+        executor, self._executor = getattr(self, '_executor', None), None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+    
+    def _create_executor(self, max_workers: int) -> Executor:
+        """Create a worker pool."""
+        if self.use_processes:
+            try:
+                return ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_worker,
+                    initargs=(self.config_path, self.enable_learning, self.cache_dir)
+                )
+            except (OSError, NotImplementedError, ImportError) as e:
+                # No working multiprocessing here (e.g. missing sem_open / /dev/shm)
+                print(f"Warning: process pool unavailable ({e}); using threads")
+                self.use_processes = False
+        return ThreadPoolExecutor(max_workers=max_workers)
+    
+    def _start_individual_writer(
+        self,
+        output_dir: Optional[str],
+        save_individual: bool
+    ) -> "_IndividualResultWriter":
+        """Start the per-file JSON writer (a no-op unless saving individual files)."""
+        if not (output_dir and save_individual):
+            return _IndividualResultWriter(None)
         
-        if self.verbose:
-            print(f"  Excel file saved: {output_path}")
-
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        return _IndividualResultWriter(
+            output_path,
+            maxsize=self.max_workers * SUBMIT_WINDOW_PER_WORKER,
+            indent=not self.compact_json
+        )
+    
+    def _start_excel_writer(self, output_path: Optional[str]) -> "_ExcelResultWriter":
+        """Start the Excel row builder (a no-op unless an Excel file is requested)."""
+        if output_path and not (XLSXWRITER_AVAILABLE or OPENPYXL_AVAILABLE):
+            print("Warning: openpyxl not available. Install with: pip install openpyxl")
+            output_path = None
+        return _ExcelResultWriter(
+            self, output_path or None,
+            maxsize=self.max_workers * SUBMIT_WINDOW_PER_WORKER
+        )
+    
+    def _iter_completed(
+        self,
+        executor: Executor,
+        paths: Iterable,
+        workers: int,
+        chunksize: int = 1
+    ) -> Iterator[tuple]:
+        """
+        Submit paths through a sliding window and yield
+        (path, result, exception) as each task finishes.
+        
+        Each task parses up to chunksize paths. At most
+        workers * SUBMIT_WINDOW_PER_WORKER tasks are pending at once;
+        a new task is submitted for every completed one.
+        
+        If a worker process dies the pool is broken: every file of the
+        tasks in flight and every file not yet submitted is yielded with
+        the BrokenProcessPool exception, so the batch still accounts for
+        all of its paths.
+        """
+        task = self._task
+        paths_iter = iter(paths)
+        inflight = {}
+        broken: Optional[BrokenProcessPool] = None
+        
+        def submit_next() -> list:
+            """Submit the next chunk; return it instead if the pool is broken."""
+            nonlocal broken
+            chunk = list(islice(paths_iter, chunksize))
+            if chunk and broken is None:
+                try:
+                    inflight[executor.submit(_run_chunk, task, [str(p) for p in chunk])] = chunk
+                    return []
+                except BrokenProcessPool as e:
+                    broken = e
+            return chunk
+        
+        rejected = []
+        for _ in range(max(1, workers * SUBMIT_WINDOW_PER_WORKER)):
+            rejected += submit_next()
+        
+        try:
+            while True:
+                for path in rejected:
+                    yield path, None, broken
+                rejected = []
+                
+                if not inflight:
+                    # Only a broken pool leaves paths behind; fail them chunk by chunk
+                    rejected = submit_next() if broken is not None else []
+                    if not rejected:
+                        break
+                    continue
+                
+                done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk = inflight.pop(future)
+                    rejected += submit_next()
+                    try:
+                        outcomes = future.result()
+                    except BrokenProcessPool as e:
+                        # A worker process died; the pool takes no new tasks
+                        broken = broken or e
+                        outcomes = [(None, e)] * len(chunk)
+                    except Exception as e:
+                        # The task itself failed
+                        outcomes = [(None, e)] * len(chunk)
+                    for path, (result, exc) in zip(chunk, outcomes):
+                        yield path, result, exc
+        finally:
+            for future in inflight:
+                future.cancel()
+    
+    @property
+    def _task(self):
+        """Callable submitted to the pool for each file."""
+        return _process_single_worker if self.use_processes else self._process_single
+    
+    def _get_pipeline(self) -> UnifiedPipeline:
+        """Return the calling thread's pipeline, building it on first use."""
+        pipeline = getattr(self._pipeline_local, 'pipeline', None)
+        if pipeline is None:
+            pipeline = UnifiedPipeline(
+                config_path=self.config_path,
+                enable_learning=self.enable_learning,
+                verbose=False  # Disable verbose for parallel processing
+            )
+            self._pipeline_local.pipeline = pipeline
+        return pipeline
+    
     def _process_single(self, file_path: str) -> Dict[str, Any]:
         """Process a single file."""
-        return self.pipeline.parse(file_path)
+        return _parse_cached(self._get_pipeline(), file_path, self.cache_dir)
     
     def _save_summary(
         self,
-        results: List[Dict[str, Any]],
+        entries: Iterable[ParseResult],
+        successful: int,
         errors: List[Dict[str, str]],
         output_path: Path
     ):
-        """Save batch processing summary."""
-        summary = {
-            'total_files': len(results) + len(errors),
-            'successful': len(results),
+        """
+        Save batch processing summary.
+        
+        The JSON document is streamed one result entry at a time, so the
+        full summary is never built in memory.
+        
+        Args:
+            entries: Flattened successful results
+            successful: Number of successful results
+            errors: Error entries
+            output_path: Summary JSON path
+        """
+        header = {
+            'total_files': successful + len(errors),
+            'successful': successful,
             'failed': len(errors),
             'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
-            'results': [
-                {
-                    'file': r['metadata']['file_name'],
-                    'sections': len(r['result'].get('sections', [])),
-                    'lines': sum(len(s.get('lines', [])) for s in r['result'].get('sections', [])),
-                    'strategy': r['strategy'],
-                    'processing_time': r['metadata']['processing_time']
-                }
-                for r in results
-            ],
-            'errors': errors
         }
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, ensure_ascii=False, indent=2)
+        with open(output_path, 'wb', buffering=1 << 20) as f:
+            # Header fields, then leave the object open for "results"
+            f.write(_dumps_json(header, indent=False)[:-1])
+            f.write(b',"results":[')
+            for i, entry in enumerate(entries):
+                f.write(b',\n' if i else b'\n')
+                f.write(_dumps_json(entry.summary_dict(), indent=False))
+            f.write(b'\n],"errors":')
+            f.write(_dumps_json(errors, indent=False))
+            f.write(b'}\n')
@@ -10,15 +10,74 @@ Features:
 - Preserves word order within columns
 """
 
-from typing import List, Dict, Any, Tuple
-from dataclasses import dataclass
-from collections import defaultdict
+import logging
+import os
+import sys
+from typing import List, Dict, Any, Tuple, Optional
+from dataclasses import dataclass, fields
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 from .word_extractor import WordMetadata
 from .layout_detector_histogram import LayoutType
 
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+# WordMetadata fields in declaration order (the keys of WordMetadata.to_dict),
+# and the ones Column.to_arrays serializes as-is (bbox is split into x0..y1)
+_WORD_ROW_FIELDS = tuple(f.name for f in fields(WordMetadata))
+_WORD_FIELDS = tuple(name for name in _WORD_ROW_FIELDS if name != 'bbox')
+
+# Pages with fewer words are assigned word by word: below this the scalar
+# loop is cheaper than building the coordinate arrays
+SCALAR_MAX_WORDS = 16
+
+
+def _overlap(word_x_start: float, word_x_end: float, col_x_start: float, col_x_end: float) -> float:
+    """Fraction of the word's x-extent that lies inside the column (0.0 to 1.0)"""
+    # Calculate intersection
+    intersection_start = max(word_x_start, col_x_start)
+    intersection_end = min(word_x_end, col_x_end)
+    
+    if intersection_start >= intersection_end:
+        return 0.0
+    
+    word_width = word_x_end - word_x_start
+    
+    if word_width == 0:
+        return 0.0
+    
+    return (intersection_end - intersection_start) / word_width
+
+
+if NUMBA_AVAILABLE:
+    # Compiled on first use (cached on disk), so importing stays cheap.
+    # No fastmath: ratios must compare against the threshold exactly as
+    # in _overlap.
+    @njit(cache=True)
+    def _assign_words_jit(w_start, w_end, c_start, c_end, threshold):
+        """First column whose overlap ratio reaches threshold per word, else -1"""
+        assignment = np.full(w_start.shape[0], -1, dtype=np.intp)
+        for i in range(w_start.shape[0]):
+            width = w_end[i] - w_start[i]
+            for j in range(c_start.shape[0]):
+                inter = min(w_end[i], c_end[j]) - max(w_start[i], c_start[j])
+                overlap = inter / width if inter > 0 and width > 0 else 0.0
+                if overlap >= threshold:
+                    assignment[i] = j
+                    break
+        return assignment
+
+
+@dataclass(slots=True)
 class Column:
     """Represents a column with its words"""
     column_id: int
@@ -36,6 +95,30 @@ class Column:
         return self.x_end - self.x_start
     
     def to_dict(self) -> Dict[str, Any]:
+        """
+        Row-oriented view of to_arrays: 'words' holds one dict per word, in
+        the same shape as WordMetadata.to_dict
+        """
+        data = self.to_arrays()
+        words = data['words']
+        words['bbox'] = list(zip(words['x0'], words['y0'], words['x1'], words['y1']))
+        data['words'] = [
+            dict(zip(_WORD_ROW_FIELDS, row))
+            for row in zip(*(words[name] for name in _WORD_ROW_FIELDS))
+        ]
+        return data
+    
+    def to_arrays(self) -> Dict[str, Any]:
+        """
+        Columnar variant of to_dict: 'words' holds one list per word field
+        (bbox split into x0/y0/x1/y1) instead of one dict per word, which is
+        much cheaper to build and serialize for large columns
+        """
+        words = self.words
+        word_fields = {name: [getattr(w, name) for w in words] for name in _WORD_FIELDS}
+        x0, y0, x1, y1 = (list(v) for v in zip(*(w.bbox for w in words))) if words else ([], [], [], [])
+        word_fields.update(x0=x0, y0=y0, x1=x1, y1=y1)
+        
         return {
             'column_id': self.column_id,
             'page': self.page,
@@ -43,7 +126,7 @@ class Column:
             'x_end': self.x_end,
             'word_count': self.word_count,
             'width': self.width,
-            'words': [w.to_dict() for w in self.words]
+            'words': word_fields
         }
 
 
@@ -62,7 +145,8 @@ class ColumnSegmenter:
         Args:
             overlap_threshold: Minimum overlap ratio to assign word to column
             min_words_per_column: Minimum words for a column to be valid
-            verbose: Print debug information
+            verbose: Log debug information (DEBUG records on this module's
+                logger; where they go is up to the application's logging setup)
         """
         self.overlap_threshold = overlap_threshold
         self.min_words_per_column = min_words_per_column
@@ -86,7 +170,7 @@ class ColumnSegmenter:
             List of Column objects
         """
         if self.verbose:
-            print(f"[ColumnSegmenter] Segmenting page {page_num + 1} into {layout.num_columns} column(s)")
+            logger.debug("[ColumnSegmenter] Segmenting page %d into %d column(s)", page_num + 1, layout.num_columns)
         
         # Create columns
         columns = []
@@ -101,61 +185,71 @@ class ColumnSegmenter:
             )
             columns.append(column)
         
-        # Assign words to columns
-        unassigned_words = []
+        # Word coordinates as one (n_words, 4) array of x0, y0, x1, y1; all
+        # the geometry below runs on it, and words are only touched to bucket
+        coords = np.array([w.bbox for w in words], dtype=np.float64).reshape(-1, 4)
+        
+        # Single column (the common resume layout): every word lands in it
+        # either way and it is never filtered, so only the Y sort is needed
+        if len(columns) == 1:
+            column = columns[0]
+            column.words = [words[i] for i in np.argsort(coords[:, 1], kind='stable')]
+            if self.verbose:
+                logger.debug("  Column 0: %d words (x: %.1f-%.1f)",
+                             column.word_count, column.x_start, column.x_end)
+            return columns
+        
+        # Nothing to assign to (words are dropped, as before)
+        if not columns:
+            return columns
         
-        for word in words:
-            assigned = False
-            
-            # Calculate overlap with each column
-            for column in columns:
-                overlap = self._calculate_overlap(word, column.x_start, column.x_end)
-                
-                if overlap >= self.overlap_threshold:
-                    column.words.append(word)
-                    assigned = True
-                    break
-            
-            if not assigned:
-                unassigned_words.append(word)
-        
-        # Handle unassigned words (assign to closest column)
-        for word in unassigned_words:
-            closest_col = self._find_closest_column(word, columns)
-            if closest_col:
-                closest_col.words.append(word)
-          # Sort words within each column by Y position (top to bottom)
-        for column in columns:
-            column.words.sort(key=lambda w: w.bbox[1])
+        # Final column of every word as one array: first column with enough
+        # overlap, else the closest column
+        if len(words) < SCALAR_MAX_WORDS:
+            assignment, num_unassigned = self._assign_words(words, columns)
+        else:
+            assignment = self._assign_columns(coords, columns)
+            unassigned = np.flatnonzero(assignment < 0)
+            num_unassigned = len(unassigned)
+            if num_unassigned:
+                # Same arithmetic as WordMetadata.x_center, straight from the array
+                centers = (coords[unassigned, 0] + coords[unassigned, 2]) / 2
+                assignment[unassigned] = self._nearest_columns(centers, columns)
         
         # Filter out columns with too few words (merge into nearest valid column)
-        valid_columns = []
-        invalid_columns = []
-        
-        for column in columns:
-            if column.word_count >= self.min_words_per_column:
-                valid_columns.append(column)
-            else:
-                invalid_columns.append(column)
+        counts = np.bincount(assignment, minlength=len(columns))
+        valid_idx = [k for k in range(len(columns)) if counts[k] >= self.min_words_per_column]
+        invalid_idx = [k for k in range(len(columns)) if counts[k] < self.min_words_per_column]
         
         # If no valid columns, keep all (don't filter)
-        if not valid_columns:
-            valid_columns = columns
-            invalid_columns = []
+        if not valid_idx:
+            valid_idx = list(range(len(columns)))
+            invalid_idx = []
         # Merge invalid columns into nearest valid column
-        elif invalid_columns:
-            for invalid_col in invalid_columns:
-                if invalid_col.words:
-                    # Find nearest valid column
-                    nearest_col = min(
-                        valid_columns,
-                        key=lambda c: abs((c.x_start + c.x_end) / 2 - (invalid_col.x_start + invalid_col.x_end) / 2)
-                    )
-                    nearest_col.words.extend(invalid_col.words)
-            
-            # Re-sort merged columns
-            for column in valid_columns:
-                column.words.sort(key=lambda w: w.bbox[1])
+        elif invalid_idx:
+            # Nearest valid column for every non-empty invalid one in a single
+            # binary search over the valid midpoints (first one on ties), then
+            # one relabelling pass over the assignment array
+            sources = [k for k in invalid_idx if counts[k]]
+            if sources:
+                invalid_mids = np.array(
+                    [(columns[k].x_start + columns[k].x_end) / 2 for k in sources], dtype=np.float64
+                )
+                targets = self._nearest_columns(invalid_mids, [columns[k] for k in valid_idx])
+                relabel = np.arange(len(columns))
+                relabel[sources] = np.asarray(valid_idx)[targets]
+                assignment = relabel[assignment]
+        
+        # One stable sort by (column, Y) puts each column's words in a
+        # contiguous top-to-bottom run; words on the same line keep
+        # extraction order
+        order = np.lexsort((coords[:, 1], assignment))
+        bounds = np.searchsorted(assignment[order], np.arange(len(columns) + 1))
+        for k in valid_idx:
+            columns[k].words = [words[i] for i in order[bounds[k]:bounds[k + 1]]]
+        
+        valid_columns = [columns[k] for k in valid_idx]
+        invalid_columns = [columns[k] for k in invalid_idx]
         
         # Re-number columns
         for idx, column in enumerate(valid_columns):
@@ -163,42 +257,57 @@ class ColumnSegmenter:
         
         if self.verbose:
             for column in valid_columns:
-                print(f"  Column {column.column_id}: {column.word_count} words "
-                      f"(x: {column.x_start:.1f}-{column.x_end:.1f})")
-            if unassigned_words:
-                print(f"  Unassigned words: {len(unassigned_words)} (redistributed)")
+                logger.debug("  Column %d: %d words (x: %.1f-%.1f)",
+                             column.column_id, column.word_count, column.x_start, column.x_end)
+            if num_unassigned:
+                logger.debug("  Unassigned words: %d (redistributed)", num_unassigned)
             if invalid_columns:
-                print(f"  Filtered {len(invalid_columns)} columns with <{self.min_words_per_column} words")
+                logger.debug("  Filtered %d columns with <%d words",
+                             len(invalid_columns), self.min_words_per_column)
         
         return valid_columns
     
     def segment_document(
         self,
         pages_words: List[List[WordMetadata]],
-        layouts: List[LayoutType]
+        layouts: List[LayoutType],
+        n_workers: Optional[int] = None
     ) -> List[List[Column]]:
         """
         Segment entire document into columns
         
+        Pages are independent, so multi-page documents are segmented on a
+        thread pool (sequentially when verbose, to keep the output readable).
+        
         Args:
             pages_words: List of word lists (one per page)
             layouts: List of layout detections (one per page)
+            n_workers: Threads to use (default: one per page, up to CPU count)
             
         Returns:
             List of column lists (one list per page)
         """
         if self.verbose:
-            print(f"[ColumnSegmenter] Segmenting {len(pages_words)} pages")
+            logger.debug("[ColumnSegmenter] Segmenting %d pages", len(pages_words))
         
-        all_columns = []
+        num_pages = min(len(pages_words), len(layouts))
+        workers = min(num_pages, n_workers or os.cpu_count() or 1)
         
-        for page_num, (words, layout) in enumerate(zip(pages_words, layouts)):
-            columns = self.segment_page(words, layout, page_num)
-            all_columns.append(columns)
+        if workers > 1 and not self.verbose:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                all_columns = list(executor.map(
+                    self.segment_page, pages_words[:num_pages], layouts[:num_pages], range(num_pages)
+                ))
+        else:
+            all_columns = []
+            
+            for page_num, (words, layout) in enumerate(zip(pages_words, layouts)):
+                columns = self.segment_page(words, layout, page_num)
+                all_columns.append(columns)
         
         if self.verbose:
-            total_columns = sum(len(page_cols) for page_cols in all_columns)
-            print(f"  Total columns across all pages: {total_columns}")
+            logger.debug("  Total columns across all pages: %d",
+                         sum(len(page_cols) for page_cols in all_columns))
         
         return all_columns
     
@@ -218,77 +327,141 @@ class ColumnSegmenter:
         if not layouts:
             return (1, [(0, 612)])
         
-        # Count column configurations
-        column_counts = defaultdict(int)
-        column_boundaries_by_count = defaultdict(list)
-        
-        for layout in layouts:
-            num_cols = layout.num_columns
-            column_counts[num_cols] += 1
-            column_boundaries_by_count[num_cols].append(layout.column_boundaries)
-        
-        # Most common number of columns
-        most_common_num = max(column_counts.items(), key=lambda x: x[1])[0]
+        # Most common number of columns (first seen wins ties)
+        column_counts = Counter(layout.num_columns for layout in layouts)
+        most_common_num, most_common_pages = column_counts.most_common(1)[0]
         
-        # Average boundaries for that configuration
-        boundaries_list = column_boundaries_by_count[most_common_num]
+        # Average boundaries for that configuration (only its pages are kept)
+        boundaries_list = [
+            layout.column_boundaries for layout in layouts
+            if layout.num_columns == most_common_num
+        ]
         
         if not boundaries_list:
             return (most_common_num, [(0, 612)])
         
-        # Average the boundaries
-        avg_boundaries = []
-        num_columns = len(boundaries_list[0])
-        
-        for col_idx in range(num_columns):
-            x_starts = [bounds[col_idx][0] for bounds in boundaries_list]
-            x_ends = [bounds[col_idx][1] for bounds in boundaries_list]
-            
-            avg_x_start = sum(x_starts) / len(x_starts)
-            avg_x_end = sum(x_ends) / len(x_ends)
-            
-            avg_boundaries.append((avg_x_start, avg_x_end))
+        # Average the boundaries: (pages, columns, 2) reduced over pages
+        avg = np.asarray(boundaries_list, dtype=np.float64).reshape(len(boundaries_list), -1, 2).mean(axis=0)
+        avg_boundaries = [(float(x_start), float(x_end)) for x_start, x_end in avg]
         
         if self.verbose:
-            print(f"[ColumnSegmenter] Global structure: {most_common_num} columns")
-            print(f"  Detected in {column_counts[most_common_num]}/{len(layouts)} pages")
+            logger.debug("[ColumnSegmenter] Global structure: %d columns", most_common_num)
+            logger.debug("  Detected in %d/%d pages", most_common_pages, len(layouts))
         
         return (most_common_num, avg_boundaries)
     
-    def _calculate_overlap(
+    def _assign_words(
         self,
-        word: WordMetadata,
-        col_x_start: float,
-        col_x_end: float
-    ) -> float:
+        words: List[WordMetadata],
+        columns: List[Column]
+    ) -> Tuple[np.ndarray, int]:
         """
-        Calculate overlap ratio between word and column
+        Find each word's column one word at a time
+        
+        Scalar counterpart of _assign_columns plus _nearest_columns, used
+        for pages too small to pay for the array setup.
         
         Args:
-            word: Word metadata
-            col_x_start: Column start x
-            col_x_end: Column end x
+            words: List of words for the page
+            columns: Non-empty list of columns, column_id equal to position
             
         Returns:
-            Overlap ratio (0.0 to 1.0)
+            Tuple of (column index per word, number of words placed by
+            distance because no column reached overlap_threshold)
         """
-        word_x_start = word.bbox[0]
-        word_x_end = word.bbox[2]
+        threshold = self.overlap_threshold
+        spans = [(column.x_start, column.x_end) for column in columns]
+        assignment = []
+        num_unassigned = 0
         
-        # Calculate intersection
-        intersection_start = max(word_x_start, col_x_start)
-        intersection_end = min(word_x_end, col_x_end)
+        for word in words:
+            bbox = word.bbox
+            x0, x1 = bbox[0], bbox[2]
+            for col_idx, (col_x_start, col_x_end) in enumerate(spans):
+                if _overlap(x0, x1, col_x_start, col_x_end) >= threshold:
+                    assignment.append(col_idx)
+                    break
+            else:
+                assignment.append(self._find_closest_column(word, columns).column_id)
+                num_unassigned += 1
         
-        if intersection_start >= intersection_end:
-            return 0.0
+        return np.array(assignment, dtype=np.intp), num_unassigned
+    
+    def _assign_columns(
+        self,
+        coords: np.ndarray,
+        columns: List[Column]
+    ) -> np.ndarray:
+        """
+        Find each word's column in one vectorized pass
         
-        intersection_width = intersection_end - intersection_start
-        word_width = word_x_end - word_x_start
+        Computes the word/column overlap ratios (as in _overlap) for all
+        pairs at once.
         
-        if word_width == 0:
-            return 0.0
+        Args:
+            coords: Word bounding boxes, shape (n_words, 4)
+            columns: List of columns
+            
+        Returns:
+            Array with the index of the first column whose overlap reaches
+            overlap_threshold for each word, or -1 if there is none
+        """
+        if not len(coords) or not columns:
+            return np.full(len(coords), -1, dtype=np.intp)
+        
+        w_start = np.ascontiguousarray(coords[:, 0])
+        w_end = np.ascontiguousarray(coords[:, 2])
+        c_start = np.fromiter((c.x_start for c in columns), dtype=np.float64, count=len(columns))
+        c_end = np.fromiter((c.x_end for c in columns), dtype=np.float64, count=len(columns))
+        
+        if NUMBA_AVAILABLE:
+            return _assign_words_jit(w_start, w_end, c_start, c_end, float(self.overlap_threshold))
+        
+        # Intersection width of every (word, column) pair, clipped at zero
+        inter = np.minimum(w_end[:, None], c_end[None, :]) - np.maximum(w_start[:, None], c_start[None, :])
+        np.clip(inter, 0.0, None, out=inter)
+        
+        # Zero-width words never overlap
+        width = w_end - w_start
+        overlap = np.divide(inter, width[:, None], out=np.zeros_like(inter), where=width[:, None] > 0)
+        
+        hits = overlap >= self.overlap_threshold
+        return np.where(hits.any(axis=1), hits.argmax(axis=1), -1)
+    
+    def _nearest_columns(
+        self,
+        centers: np.ndarray,
+        columns: List[Column]
+    ) -> np.ndarray:
+        """
+        Find the column whose center is closest to each x position
+        
+        Binary search over the sorted column centers, then one vectorized
+        left/right neighbour comparison; ties go to the earlier column, as
+        in _find_closest_column.
         
-        return intersection_width / word_width
+        Args:
+            centers: X positions (word or column centers)
+            columns: Non-empty list of columns
+            
+        Returns:
+            Array of column indices, one per center
+        """
+        mids = np.fromiter(((c.x_start + c.x_end) / 2 for c in columns), dtype=np.float64, count=len(columns))
+        order = np.argsort(mids, kind='stable')
+        sorted_mids = mids[order]
+        last = len(columns) - 1
+        
+        # Neighbours on either side of each center; equal centers resolve to
+        # the first (lowest index) column sharing that position
+        idx = np.searchsorted(sorted_mids, centers)
+        left = np.searchsorted(sorted_mids, sorted_mids[np.clip(idx - 1, 0, last)])
+        right = np.clip(idx, 0, last)
+        
+        d_left = np.abs(centers - sorted_mids[left])
+        d_right = np.abs(sorted_mids[right] - centers)
+        pick_left = (d_left < d_right) | ((d_left == d_right) & (order[left] < order[right]))
+        return order[np.where(pick_left, left, right)]
     
     def _find_closest_column(
         self,
@@ -298,6 +471,9 @@ class ColumnSegmenter:
         """
         Find closest column to word
         
+        Single-word helper for _assign_words; larger pages place all
+        unassigned words at once with _nearest_columns.
+        
         Args:
             word: Word metadata
             columns: List of columns
@@ -325,11 +501,15 @@ class ColumnSegmenter:
 
 
 if __name__ == "__main__":
-    import sys
     from .document_detector import DocumentDetector
     from .word_extractor import WordExtractor
     from .layout_detector_histogram import LayoutDetector
     
+    # Script entry point: show this module's debug records (the verbose
+    # segmenter below) without turning on every library's debug logging
+    logging.basicConfig(format="%(message)s", stream=sys.stdout)
+    logger.setLevel(logging.DEBUG)
+    
     if len(sys.argv) < 2:
         print("Usage: python column_segmenter.py <file_path>")
         sys.exit(1)
@@ -8,12 +8,88 @@ import re
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+import torch
 from transformers import AutoTokenizer, AutoModelForTokenClassification, pipeline
 from transformers.utils import logging as transformers_logging
 
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    re2 = None
+    RE2_AVAILABLE = False
+
 # Suppress transformers logging
 transformers_logging.set_verbosity_error()
 
+# NER inference backend: "torch" (default) or "onnx-int8" (ONNX Runtime, dynamic int8)
+NER_BACKEND = os.getenv("NER_BACKEND", "torch")
+
+# Longest NER input in tokens (special tokens included)
+NER_MAX_TOKENS = 512
+
+# Text chunks per NER forward pass
+NER_BATCH_SIZE = int(os.getenv("NER_BATCH_SIZE", "16"))
+
+# Engine for the text-scanning patterns below: "re" (default) or "re2"
+# (google-re2, linear time; its \d, \w and \s are ASCII-only)
+REGEX_ENGINE = os.getenv("REGEX_ENGINE", "re")
+_scan_re = re2 if REGEX_ENGINE == "re2" and RE2_AVAILABLE else re
+
+# Section-name keywords that mark a section as work history
+EXPERIENCE_SECTION_KEYWORDS = (
+    'experience', 'employment', 'work history', 'career', 'professional background'
+)
+
+# Contact patterns
+_EMAIL_RE = _scan_re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+# Mobile formats in priority order, one group each, scanned in a single
+# pass; the lookahead reports overlapping candidates too, so a lower
+# priority match can't hide a better one that starts inside it (re2 has
+# no lookarounds, so this one always uses re)
+_MOBILE_RE = re.compile(
+    r'(?=(\+91[-\s]?\d{10})'
+    r'|(\b\d{10}\b)'
+    r'|(\+91[-\s]?\d{5}[-\s]?\d{5})'
+    r'|(\b\d{5}[-\s]?\d{5}\b))'
+)
+_MOBILE_SEPARATOR_RE = re.compile(r'[-\s]')
+
+# Experience section start headers, in priority order (case-insensitive)
+_EXP_HEADER_RES = [
+    _scan_re.compile(r'(?i)(?:professional\s+)?(?:work\s+)?experience'),
+    _scan_re.compile(r'(?i)employment\s+history'),
+    _scan_re.compile(r'(?i)work\s+history'),
+    _scan_re.compile(r'(?i)professional\s+background'),
+    _scan_re.compile(r'(?i)career\s+history'),
+]
+
+# Headers that end the experience section; the earliest one wins, so a
+# single alternation finds it in one scan
+_END_HEADER_RE = _scan_re.compile('(?i)' + '|'.join([
+    r'education',
+    r'academic',
+    r'qualifications',
+    r'skills',
+    r'technical\s+skills',
+    r'certifications',
+    r'projects',
+    r'achievements',
+]))
+
+_EXPLICIT_EXP_RES = [
+    _scan_re.compile(r'(?i)(\d+\.?\d*)\+?\s*(?:years?|yrs?)(?:\s+of)?(?:\s+professional)?(?:\s+experience)'),
+    _scan_re.compile(r'(?i)experience[:\s]+(\d+\.?\d*)\+?\s*(?:years?|yrs?)'),
+    _scan_re.compile(r'(?i)total\s+experience[:\s]+(\d+\.?\d*)\+?\s*(?:years?|yrs?)'),
+]
+
+_DATE_FMTS = [
+    _scan_re.compile(r'(\w+)\s+(\d{4})'),  # "Jan 2020"
+    _scan_re.compile(r'(\d{1,2})/(\d{4})'),  # "01/2020"
+    _scan_re.compile(r'(\d{4})'),  # "2020"
+]
+
 
 class CompleteResumeParser:
     """
@@ -33,16 +109,55 @@ class CompleteResumeParser:
         """
         print("🚀 Initializing Complete Resume Parser...")
         
+        if REGEX_ENGINE == "re2" and not RE2_AVAILABLE:
+            print("⚠️  google-re2 not installed, falling back to re for text scanning")
+        
         # Load NER model
         print("   Loading NER model...")
         self.tokenizer = AutoTokenizer.from_pretrained(model_path)
-        self.model = AutoModelForTokenClassification.from_pretrained(model_path)
-        self.ner_pipeline = pipeline(
-            "ner", 
-            model=self.model, 
-            tokenizer=self.tokenizer, 
-            aggregation_strategy="simple"
-        )
+        self.model = None
+        self.ner_pipeline = None
+        
+        if NER_BACKEND == "onnx-int8":
+            try:
+                self.model = self._load_onnx_int8_model(model_path)
+                from optimum.pipelines import pipeline as ort_pipeline
+                self.ner_pipeline = ort_pipeline(
+                    "ner",
+                    model=self.model,
+                    tokenizer=self.tokenizer,
+                    accelerator="ort",
+                    aggregation_strategy="simple",
+                    batch_size=NER_BATCH_SIZE
+                )
+                print("   Using ONNX Runtime int8 NER backend")
+            except ImportError:
+                print("⚠️  optimum[onnxruntime] not installed, falling back to PyTorch NER backend")
+        
+        if self.ner_pipeline is None:
+            # low_cpu_mem_usage loads weights directly (mmapped for safetensors checkpoints)
+            self.model = AutoModelForTokenClassification.from_pretrained(
+                model_path,
+                low_cpu_mem_usage=True
+            )
+            self.model.eval()
+            
+            # Half precision on GPU (bf16 where supported, else fp16); CPU stays fp32
+            device = -1
+            if torch.cuda.is_available():
+                dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+                self.model.to(device="cuda", dtype=dtype)
+                device = 0
+                print(f"   Using GPU NER backend ({str(dtype).replace('torch.', '')})")
+            
+            self.ner_pipeline = pipeline(
+                "ner", 
+                model=self.model, 
+                tokenizer=self.tokenizer, 
+                aggregation_strategy="simple",
+                batch_size=NER_BATCH_SIZE,
+                device=device
+            )
         
         # Load name/location extractor
         print("   Loading name/location extractor...")
@@ -51,6 +166,29 @@ class CompleteResumeParser:
         
         print("✅ Parser initialized successfully!\n")
     
+    def _load_onnx_int8_model(self, model_path: str):
+        """
+        Load the NER model as a dynamically int8-quantized ONNX model
+        
+        The model is exported and quantized on first use and stored under
+        NER_ONNX_DIR (default: <model_path>/onnx-int8) for later runs.
+        """
+        from optimum.onnxruntime import ORTModelForTokenClassification, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        
+        quantized_dir = os.getenv("NER_ONNX_DIR", os.path.join(model_path, "onnx-int8"))
+        quantized_file = "model_quantized.onnx"
+        
+        if not os.path.exists(os.path.join(quantized_dir, quantized_file)):
+            print("   Exporting NER model to ONNX and quantizing to int8...")
+            onnx_model = ORTModelForTokenClassification.from_pretrained(model_path, export=True)
+            quantizer = ORTQuantizer.from_pretrained(onnx_model)
+            qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+            quantizer.quantize(save_dir=quantized_dir, quantization_config=qconfig)
+            onnx_model.config.save_pretrained(quantized_dir)
+        
+        return ORTModelForTokenClassification.from_pretrained(quantized_dir, file_name=quantized_file)
+    
     def parse_resume(self, resume_text: str, 
                      filename: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -81,10 +219,53 @@ class CompleteResumeParser:
         if experience_text:
             experiences = self._extract_experiences(experience_text)
         
-        # Step 5: Calculate total experience
+        return self._compile_result(resume_text, contact_info, name_location, experiences)
+    
+    def parse_resume_with_experiences(self, resume_text: str,
+                                      experiences: List[Dict[str, Any]],
+                                      filename: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Parse resume using experiences that were already extracted
+        (e.g. by running NER per section in parallel)
+        
+        Args:
+            resume_text: Full resume text (used for contact/name/total experience)
+            experiences: Pre-extracted experience entries
+            filename: Optional filename for name extraction
+            
+        Returns:
+            Dictionary with structured resume data
+        """
+        contact_info = self._extract_contact_info(resume_text)
+        name_location = self.name_location_extractor.extract_name_and_location(
+            resume_text,
+            filename=filename,
+            email=contact_info.get('email')
+        )
+        return self._compile_result(resume_text, contact_info, name_location, experiences)
+    
+    def select_experience_sections(self, sections: Dict[str, str]) -> Dict[str, str]:
+        """
+        Pick the sections that should go through experience NER,
+        using the section name as a prior
+        
+        Falls back to all sections when none look like work history.
+        """
+        selected = {
+            name: content for name, content in sections.items()
+            if any(keyword in name.lower() for keyword in EXPERIENCE_SECTION_KEYWORDS)
+        }
+        return selected or dict(sections)
+    
+    def _compile_result(self, resume_text: str,
+                        contact_info: Dict[str, Optional[str]],
+                        name_location: Dict[str, Any],
+                        experiences: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Calculate derived fields and compile the final result"""
+        # Calculate total experience
         total_experience = self._calculate_total_experience(resume_text, experiences)
         
-        # Step 6: Determine primary role
+        # Determine primary role
         primary_role = self._determine_primary_role(experiences)
         
         # Compile final result
@@ -112,43 +293,32 @@ class CompleteResumeParser:
     
     def _extract_email(self, text: str) -> Optional[str]:
         """Extract email address"""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        matches = re.findall(email_pattern, text)
-        return matches[0] if matches else None
+        match = _EMAIL_RE.search(text)
+        return match.group(0) if match else None
     
     def _extract_mobile(self, text: str) -> Optional[str]:
         """Extract mobile number"""
-        patterns = [
-            r'\+91[-\s]?\d{10}',
-            r'\b\d{10}\b',
-            r'\+91[-\s]?\d{5}[-\s]?\d{5}',
-            r'\b\d{5}[-\s]?\d{5}\b'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                mobile = re.sub(r'[-\s]', '', matches[0])
-                return mobile
+        # First match of the highest-priority format present
+        best = None
+        for match in _MOBILE_RE.finditer(text):
+            if best is None or match.lastindex < best.lastindex:
+                best = match
+                if best.lastindex == 1:
+                    break
         
-        return None
+        if best is None:
+            return None
+        
+        mobile = _MOBILE_SEPARATOR_RE.sub('', best.group(best.lastindex))
+        return mobile
     
     def _extract_experience_section(self, text: str) -> Optional[str]:
         """Extract the experience/work history section"""
-        headers = [
-            r'(?:professional\s+)?(?:work\s+)?experience',
-            r'employment\s+history',
-            r'work\s+history',
-            r'professional\s+background',
-            r'career\s+history'
-        ]
-        
-        text_lower = text.lower()
-        
-        # Find experience section start
+        # Patterns are case-insensitive and run on the text itself: no
+        # lowercased copy, and match offsets always index into text
         start_idx = -1
-        for header in headers:
-            match = re.search(header, text_lower)
+        for header in _EXP_HEADER_RES:
+            match = header.search(text)
             if match:
                 start_idx = match.start()
                 break
@@ -157,42 +327,34 @@ class CompleteResumeParser:
             return text
         
         # Find next major section
-        end_headers = [
-            r'education',
-            r'academic',
-            r'qualifications',
-            r'skills',
-            r'technical\s+skills',
-            r'certifications',
-            r'projects',
-            r'achievements'
-        ]
-        
         end_idx = len(text)
-        for end_header in end_headers:
-            match = re.search(end_header, text_lower[start_idx + 50:])
-            if match:
-                potential_end = start_idx + 50 + match.start()
-                end_idx = min(end_idx, potential_end)
+        match = _END_HEADER_RE.search(text, start_idx + 50)
+        if match:
+            end_idx = match.start()
         
         return text[start_idx:end_idx]
     
     def _extract_experiences(self, experience_text: str) -> List[Dict[str, Any]]:
         """Extract work experiences using NER model"""
         # Chunk the text for processing
-        max_chunk_size = 512
-        chunks = [experience_text[i:i+max_chunk_size] 
-                  for i in range(0, len(experience_text), max_chunk_size)]
+        chunks = self._chunk_text(experience_text)
         
-        # Run NER on all chunks
+        # Run NER on all chunks in one batched call
         all_entities = []
-        for chunk in chunks:
+        with torch.inference_mode():
             try:
-                chunk_results = self.ner_pipeline(chunk)
-                all_entities.extend(chunk_results)
-            except Exception as e:
-                print(f"⚠️  Warning: Error processing chunk: {e}")
-                continue
+                for chunk_results in self.ner_pipeline(chunks):
+                    all_entities.extend(chunk_results)
+            except Exception:
+                # Fall back to one chunk at a time so a bad chunk only loses itself
+                all_entities = []
+                for chunk in chunks:
+                    try:
+                        chunk_results = self.ner_pipeline(chunk)
+                        all_entities.extend(chunk_results)
+                    except Exception as e:
+                        print(f"⚠️  Warning: Error processing chunk: {e}")
+                        continue
         
         # Deduplicate entities
         entities = self._deduplicate_entities(all_entities)
@@ -205,6 +367,51 @@ class CompleteResumeParser:
         
         return experiences
     
+    def _chunk_text(self, text: str) -> List[str]:
+        """
+        Split text into chunks that each fit one model input
+        
+        The text is tokenized once and cut into windows of whole words of up
+        to NER_MAX_TOKENS tokens, using the token offsets to slice the
+        original string, so no word is split across chunks. Slow tokenizers
+        (no offsets) fall back to fixed 512-character slices.
+        """
+        if not text:
+            return []
+        
+        if not getattr(self.tokenizer, 'is_fast', False):
+            return [text[i:i + 512] for i in range(0, len(text), 512)]
+        
+        max_tokens = min(NER_MAX_TOKENS, self.tokenizer.model_max_length)
+        window = max(1, max_tokens - self.tokenizer.num_special_tokens_to_add())
+        
+        encoding = self.tokenizer(text, add_special_tokens=False, return_offsets_mapping=True)
+        offsets = encoding['offset_mapping']
+        word_ids = encoding.word_ids()
+        n_tokens = len(offsets)
+        
+        if n_tokens <= window:
+            return [text]
+        
+        def mid_word(k: int) -> bool:
+            return word_ids[k] is not None and word_ids[k] == word_ids[k - 1]
+        
+        # Token index where each chunk starts, moved back to a word start
+        starts = [0]
+        while starts[-1] + window < n_tokens:
+            cut = starts[-1] + window
+            while cut > starts[-1] + 1 and mid_word(cut):
+                cut -= 1
+            if mid_word(cut):
+                # A single word longer than the window: cut inside it
+                cut = starts[-1] + window
+            starts.append(cut)
+        
+        # Each chunk runs up to the next chunk's first character, so
+        # whitespace between chunks is kept and nothing is dropped
+        char_starts = [0] + [offsets[k][0] for k in starts[1:]] + [len(text)]
+        return [text[char_starts[k]:char_starts[k + 1]] for k in range(len(starts))]
+    
     def _deduplicate_entities(self, entities: List[Dict]) -> List[Dict]:
         """
         Remove duplicate entities and merge subword tokens
@@ -447,14 +654,8 @@ class CompleteResumeParser:
             return 'Present'
         
         # Try various date formats
-        formats = [
-            r'(\w+)\s+(\d{4})',  # "Jan 2020"
-            r'(\d{1,2})/(\d{4})',  # "01/2020"
-            r'(\d{4})',  # "2020"
-        ]
-        
-        for fmt in formats:
-            match = re.search(fmt, date_str)
+        for fmt in _DATE_FMTS:
+            match = fmt.search(date_str)
             if match:
                 return match.group(0)
         
@@ -530,14 +731,8 @@ class CompleteResumeParser:
     
     def _find_explicit_experience(self, text: str) -> Optional[float]:
         """Find explicit experience mentions"""
-        patterns = [
-            r'(\d+\.?\d*)\+?\s*(?:years?|yrs?)(?:\s+of)?(?:\s+professional)?(?:\s+experience)',
-            r'experience[:\s]+(\d+\.?\d*)\+?\s*(?:years?|yrs?)',
-            r'total\s+experience[:\s]+(\d+\.?\d*)\+?\s*(?:years?|yrs?)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _EXPLICIT_EXP_RES:
+            match = pattern.search(text)
             if match:
                 try:
                     return float(match.group(1))
@@ -5,11 +5,56 @@ Uses embeddings to discover new section types and prevent false positives.
 """
 
 import json
+import os
+import threading
 import numpy as np
 from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 from collections import Counter
 
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    fcntl = None
+    FCNTL_AVAILABLE = False
+
+
+def _merge_config(on_disk: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Fold what another learner saved (on_disk) into config: sections and
+    variants config lacks, false positives and discovered sections.
+    Everything else keeps config's value.
+    """
+    sections = config.setdefault('sections', {})
+    for name, disk_section in on_disk.get('sections', {}).items():
+        section = sections.get(name)
+        if section is None:
+            sections[name] = disk_section
+            continue
+        variants = section.setdefault('variants', [])
+        known = {v.lower() for v in variants}
+        for variant in disk_section.get('variants', []):
+            if variant.lower() not in known:
+                variants.append(variant)
+                known.add(variant.lower())
+    
+    disk_learning = on_disk.get('learning', {})
+    if disk_learning:
+        learning = config.setdefault('learning', {})
+        false_positives = learning.setdefault('false_positives', [])
+        for heading in disk_learning.get('false_positives', []):
+            if heading not in false_positives:
+                false_positives.append(heading)
+        discovered = learning.setdefault('new_sections_discovered', [])
+        discovered_names = {entry.get('name') for entry in discovered}
+        for entry in disk_learning.get('new_sections_discovered', []):
+            if entry.get('name') not in discovered_names:
+                discovered.append(entry)
+                discovered_names.add(entry.get('name'))
+    
+    return config
+
 
 class SectionLearner:
     """
@@ -64,10 +109,43 @@ class SectionLearner:
         }
     
     def _save_config(self):
-        """Save updated configuration"""
+        """
+        Save updated configuration.
+        
+        Several learners (e.g. one per batch worker) may share the file, so
+        the save holds an exclusive lock on <config>.lock, first merges in
+        what others saved since this one loaded, and replaces the file
+        atomically so readers never see a partial write.
+        """
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.config_path, 'w', encoding='utf-8') as f:
-            json.dump(self.config, f, indent=2, ensure_ascii=False)
+        lock_path = self.config_path.with_name(self.config_path.name + '.lock')
+        
+        with open(lock_path, 'a') as lock_file:
+            if FCNTL_AVAILABLE:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            
+            try:
+                with open(self.config_path, 'r', encoding='utf-8') as f:
+                    on_disk = json.load(f)
+            except (OSError, ValueError):
+                on_disk = None
+            if on_disk:
+                self.config = _merge_config(on_disk, self.config)
+            
+            tmp_path = self.config_path.with_name(
+                f"{self.config_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self.config, f, indent=2, ensure_ascii=False)
+                os.replace(tmp_path, self.config_path)
+            except OSError:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise
+            # Closing lock_file releases the lock
     
     def _get_embedding_model(self):
         """Lazy load embedding model"""
@@ -284,7 +284,9 @@ class UnifiedResumeParser:
             if self.save_debug:
                 debug_data['columns'] = {
                     'total_columns': total_columns,
-                    'columns_per_page': [len(page_cols) for page_cols in all_columns]
+                    'columns_per_page': [len(page_cols) for page_cols in all_columns],
+                    # Columnar word lists: far smaller JSON than one dict per word
+                    'pages': [[column.to_arrays() for column in page_cols] for page_cols in all_columns]
                 }
             
             if self.verbose:
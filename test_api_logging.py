@@ -0,0 +1,37 @@
+"""
+Tests for the API's queue-based logging setup across lifespan restarts
+"""
+
+import logging
+from logging.handlers import QueueHandler
+
+from src.api.main import _setup_logging, _teardown_logging
+
+
+def _queue_handlers():
+    return [h for h in logging.getLogger('src.api').handlers if isinstance(h, QueueHandler)]
+
+
+def test_restart_does_not_duplicate_handlers():
+    """Setting up logging again (e.g. after a reload) keeps a single queue handler"""
+    first = _setup_logging()
+    second = _setup_logging()
+    try:
+        assert _queue_handlers() == [second[1]]
+    finally:
+        first[0].stop()
+        _teardown_logging(*second)
+
+
+def test_teardown_detaches_handler():
+    """After shutdown no records go to the stopped listener's queue"""
+    listener, handler = _setup_logging()
+    _teardown_logging(listener, handler)
+
+    assert _queue_handlers() == []
+
+
+if __name__ == "__main__":
+    test_restart_does_not_duplicate_handlers()
+    test_teardown_detaches_handler()
+    print("✅ API logging tests passed")
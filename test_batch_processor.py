@@ -0,0 +1,136 @@
+"""
+Tests for BatchProcessor's worker pool: results, errors and recovery
+after a worker process dies
+"""
+
+import os
+import time
+
+import pytest
+
+from src.core.batch_processor import BatchProcessor, MAX_TASK_CHUNK
+
+
+def _fake_parse(file_path: str):
+    """Stand-in for the pipeline; files named crash* kill their worker process"""
+    name = os.path.basename(file_path)
+    if name.startswith('crash'):
+        os._exit(1)
+    if name.startswith('bad'):
+        raise ValueError(f"cannot parse {name}")
+    # Parsing takes a moment, so tasks are still queued when a worker dies
+    time.sleep(0.01)
+    return {
+        'success': True,
+        'strategy': 'test',
+        'metadata': {'file_name': name, 'file_path': file_path, 'processing_time': 0.0},
+        'result': {'sections': [{'section': 'Experience', 'lines': [f"Worked on {name}"]}]}
+    }
+
+
+class FakeBatchProcessor(BatchProcessor):
+    """BatchProcessor that runs _fake_parse instead of building pipelines"""
+
+    @property
+    def _task(self):
+        return _fake_parse
+
+
+def _make_files(directory, names):
+    paths = []
+    for name in names:
+        path = directory / name
+        path.write_text("resume")
+        paths.append(str(path))
+    return paths
+
+
+def test_thread_pool_batch(tmp_path):
+    """Thread mode returns every success and records failures as errors"""
+    files = _make_files(tmp_path, ['a.pdf', 'bad.pdf', 'b.pdf'])
+
+    with FakeBatchProcessor(max_workers=2, use_processes=False, enable_learning=False) as processor:
+        result = processor.process_files(files)
+
+    assert (result.total, result.successful, result.failed) == (3, 2, 1)
+    assert result.errors[0]['file'].endswith('bad.pdf')
+    assert sorted(r['metadata']['file_name'] for r in result.results) == ['a.pdf', 'b.pdf']
+
+
+def test_process_batch_writes_excel(tmp_path):
+    """Rows built during the batch end up in the workbook under the final header"""
+    openpyxl = pytest.importorskip("openpyxl")
+    files = _make_files(tmp_path, ['a.pdf', 'bad.pdf', 'b.pdf'])
+    output = str(tmp_path / "results.xlsx")
+
+    with FakeBatchProcessor(max_workers=2, use_processes=False, enable_learning=False) as processor:
+        summary = processor.process_batch(files, output_excel=output)
+
+    assert summary['successful'] == 2
+    sheet = openpyxl.load_workbook(output).active
+    rows = [[cell.value for cell in row] for row in sheet.iter_rows()]
+    assert rows[0] == ['File Name', 'Success', 'Strategy', 'Processing Time (s)',
+                       'Total Sections', 'Contact Info', 'Experience']
+    assert sorted((row[0], row[4], row[6]) for row in rows[1:]) == [
+        ('a.pdf', 1, 'Worked on a.pdf'), ('b.pdf', 1, 'Worked on b.pdf')
+    ]
+
+
+def test_process_pool_reused_across_batches(tmp_path):
+    """The same worker pool serves consecutive batches"""
+    files = _make_files(tmp_path, ['a.pdf', 'b.pdf', 'c.pdf'])
+
+    with FakeBatchProcessor(max_workers=2, enable_learning=False) as processor:
+        first = processor.process_files(files)
+        executor = processor._executor
+        second = processor.process_files(files)
+
+        assert processor._executor is executor
+    assert first.successful == second.successful == 3
+
+
+def test_worker_crash_is_recorded_and_pool_replaced(tmp_path):
+    """A dying worker fails the batch's files instead of raising, and the next batch runs"""
+    files = _make_files(tmp_path, ['a.pdf', 'crash.pdf', 'b.pdf', 'c.pdf'])
+
+    with FakeBatchProcessor(max_workers=2, enable_learning=False) as processor:
+        crashed = processor.process_files(files)
+
+        assert crashed.total == len(files)
+        assert crashed.failed >= 1
+        assert any(e['file'].endswith('crash.pdf') for e in crashed.errors)
+        assert processor._executor is None
+
+        good = [f for f in files if not os.path.basename(f).startswith('crash')]
+        recovered = processor.process_files(good)
+
+    assert (recovered.total, recovered.successful, recovered.failed) == (3, 3, 0)
+
+
+def test_worker_crash_with_chunked_tasks(tmp_path):
+    """Large batches send several files per task; a crash still accounts for every file"""
+    names = [f"r{i:03d}.pdf" for i in range(MAX_TASK_CHUNK * 40)]
+    names[MAX_TASK_CHUNK] = 'crash.pdf'
+    files = _make_files(tmp_path, names)
+
+    with FakeBatchProcessor(max_workers=2, enable_learning=False) as processor:
+        crashed = processor.process_files(files)
+
+        assert crashed.total == len(files)
+        assert crashed.successful + crashed.failed == len(files)
+        assert any(e['file'].endswith('crash.pdf') for e in crashed.errors)
+
+        recovered = processor.process_files(files[:MAX_TASK_CHUNK])
+
+    assert recovered.successful == MAX_TASK_CHUNK
+
+
+if __name__ == "__main__":
+    import tempfile
+    from pathlib import Path
+
+    for test in (test_thread_pool_batch, test_process_batch_writes_excel, test_process_pool_reused_across_batches,
+                 test_worker_crash_is_recorded_and_pool_replaced, test_worker_crash_with_chunked_tasks):
+        with tempfile.TemporaryDirectory() as tmp:
+            test(Path(tmp))
+    print("✅ Batch processor tests passed")
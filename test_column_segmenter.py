@@ -0,0 +1,153 @@
+"""
+Tests for ColumnSegmenter
+"""
+
+import logging
+import random
+
+from src.core.column_segmenter import Column, ColumnSegmenter
+from src.core.layout_detector_histogram import LayoutType
+from src.core.word_extractor import WordMetadata
+
+
+def _layout(boundaries):
+    return LayoutType(
+        type=1 if len(boundaries) == 1 else 2,
+        type_name='test',
+        num_columns=len(boundaries),
+        column_boundaries=list(boundaries),
+        histogram={},
+        peaks=[],
+        valleys=[],
+        confidence=1.0,
+        page_width=612.0,
+        metadata={}
+    )
+
+
+def _word(text, x0, y0, width=20.0, page=0):
+    return WordMetadata(text=text, page=page, bbox=(x0, y0, x0 + width, y0 + 10.0))
+
+
+def _reference_segment_page(words, layout, overlap_threshold=0.5, min_words_per_column=10):
+    """
+    Word-by-word segmentation, as segment_page did before it was vectorized
+
+    Returns one (x_start, x_end, words) tuple per kept column.
+    """
+    columns = [(x_start, x_end, []) for x_start, x_end in layout.column_boundaries]
+
+    def overlap(word, x_start, x_end):
+        inter = min(word.bbox[2], x_end) - max(word.bbox[0], x_start)
+        width = word.bbox[2] - word.bbox[0]
+        return inter / width if inter > 0 and width > 0 else 0.0
+
+    def closest(x, candidates):
+        # min() keeps the first of equally close columns
+        return min(candidates, key=lambda c: abs((c[0] + c[1]) / 2 - x))
+
+    unassigned = []
+    for word in words:
+        for column in columns:
+            if overlap(word, column[0], column[1]) >= overlap_threshold:
+                column[2].append(word)
+                break
+        else:
+            unassigned.append(word)
+    if columns:
+        for word in unassigned:
+            closest(word.x_center, columns)[2].append(word)
+
+    valid = [c for c in columns if len(c[2]) >= min_words_per_column] or columns
+    if len(columns) > 1:
+        for column in columns:
+            if column not in valid and column[2]:
+                closest((column[0] + column[1]) / 2, valid)[2].extend(column[2])
+
+    for column in valid:
+        column[2].sort(key=lambda w: w.bbox[1])
+    return valid
+
+
+def _random_page(rng, num_columns, num_words, grid=False):
+    # On a grid, overlaps hit the threshold exactly and distances tie
+    coord = (lambda lo, hi: 10.0 * rng.randint(int(lo) // 10, int(hi) // 10)) if grid else rng.uniform
+    cuts = sorted(coord(50.0, 562.0) for _ in range(num_columns - 1))
+    edges = [0.0] + cuts + [612.0]
+    layout = _layout(list(zip(edges[:-1], edges[1:])))
+
+    words = []
+    for i in range(num_words):
+        # Zero-width words, words off the page and shared lines included
+        width = rng.choice([0.0, coord(10.0, 120.0)])
+        y0 = rng.choice([rng.uniform(0.0, 800.0), 20.0 * rng.randint(0, 40)])
+        words.append(_word(f"w{i}", coord(-20.0, 612.0), y0, width=width))
+    return words, layout
+
+
+def test_segment_page_matches_word_by_word_assignment():
+    """Vectorized segmentation puts the same words in the same columns, top to bottom"""
+    rng = random.Random(0)
+
+    for trial in range(400):
+        words, layout = _random_page(
+            rng, rng.choice([1, 2, 3, 4, 6]), rng.choice([0, 3, 15, 60, 300]), grid=trial % 2 == 1
+        )
+        threshold = rng.choice([0.3, 0.5, 0.9])
+        min_words = rng.choice([0, 10, 40])
+
+        segmenter = ColumnSegmenter(overlap_threshold=threshold, min_words_per_column=min_words)
+        columns = segmenter.segment_page(words, layout)
+        expected = _reference_segment_page(words, layout, threshold, min_words)
+
+        assert [(c.x_start, c.x_end) for c in columns] == [(c[0], c[1]) for c in expected]
+        assert [c.column_id for c in columns] == list(range(len(columns)))
+        for column, (_, _, expected_words) in zip(columns, expected):
+            # Same words; order only differs between words on the same line
+            assert sorted(w.text for w in column.words) == sorted(w.text for w in expected_words)
+            assert [w.bbox[1] for w in column.words] == [w.bbox[1] for w in expected_words]
+
+
+def test_column_serialization():
+    """to_arrays holds one list per word field; to_dict gives WordMetadata.to_dict rows"""
+    words = [_word("Python", 10.0, 20.0), WordMetadata(
+        text="Engineer", page=0, bbox=(40.0, 30.0, 90.0, 42.0),
+        font_size=11.0, font_color=(0, 0, 0), is_bold=True
+    )]
+    column = Column(column_id=0, page=0, x_start=0.0, x_end=100.0, words=words)
+
+    arrays = column.to_arrays()
+    assert arrays['words']['text'] == ["Python", "Engineer"]
+    assert arrays['words']['x0'] == [10.0, 40.0]
+    assert arrays['words']['y1'] == [30.0, 42.0]
+    assert arrays['words']['is_bold'] == [False, True]
+    assert 'bbox' not in arrays['words']
+
+    data = column.to_dict()
+    assert data['words'] == [w.to_dict() for w in words]
+    assert [list(w) for w in data['words']] == [list(w.to_dict()) for w in words]
+    assert {k: v for k, v in data.items() if k != 'words'} == {
+        k: v for k, v in arrays.items() if k != 'words'
+    }
+    assert Column(column_id=1, page=0, x_start=0.0, x_end=1.0, words=[]).to_dict()['words'] == []
+
+
+def test_verbose_is_per_instance(caplog):
+    """A verbose segmenter doesn't make other segmenters log"""
+    words = [_word(f"w{i}", 50.0, 20.0 * i) for i in range(12)]
+    layout = _layout([(0.0, 612.0)])
+
+    ColumnSegmenter(verbose=True)
+    with caplog.at_level(logging.DEBUG, logger='src.core.column_segmenter'):
+        ColumnSegmenter(verbose=False).segment_page(words, layout)
+        assert not caplog.records
+
+        ColumnSegmenter(verbose=True).segment_page(words, layout)
+        assert caplog.records
+
+    assert not logging.getLogger('src.core.column_segmenter').handlers
+
+
+if __name__ == "__main__":
+    import pytest
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,92 @@
+"""
+Tests for CompleteResumeParser._chunk_text
+"""
+
+import random
+
+from tokenizers import BertWordPieceTokenizer
+from transformers import PreTrainedTokenizerFast
+
+import src.core.complete_resume_parser as complete_resume_parser
+from src.core.complete_resume_parser import CompleteResumeParser
+
+VOCAB = [
+    "[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]",
+    "software", "engineer", "at", "acme", "corp", "from", "to", "present",
+    "senior", "data", "develop", "##ed", "##er", "##ing", "##s", "lead",
+    "team", "of", "python", ",", ".", "-", "2019", "2021",
+]
+
+WORDS = [
+    "Software", "Engineer", "at", "Acme", "Corp", "from", "2019", "to",
+    "Present", "Senior", "Developers", "leading", "teams", "of", "Python",
+    "developing", "data", ",", ".", "-", "2021", "Zyx",
+]
+
+
+def _make_parser(tmp_path, monkeypatch, max_tokens):
+    # A tiny uncased WordPiece tokenizer, built like bert-base's fast tokenizer
+    tokenizer_file = tmp_path / "tokenizer.json"
+    BertWordPieceTokenizer({token: i for i, token in enumerate(VOCAB)}).save(str(tokenizer_file))
+    monkeypatch.setattr(complete_resume_parser, "NER_MAX_TOKENS", max_tokens)
+
+    # Only the tokenizer is needed; skip loading the NER model
+    parser = CompleteResumeParser.__new__(CompleteResumeParser)
+    parser.tokenizer = PreTrainedTokenizerFast(tokenizer_file=str(tokenizer_file))
+    return parser
+
+
+def _random_text(rng, n_words):
+    separators = [" ", " ", " ", "  ", "\n", "\n\n"]
+    return "".join(rng.choice(WORDS) + rng.choice(separators) for _ in range(n_words))
+
+
+def _token_count(tokenizer, text):
+    return len(tokenizer(text, add_special_tokens=False)["input_ids"])
+
+
+def test_short_text_is_one_chunk(tmp_path, monkeypatch):
+    """Text that fits the window comes back unchanged"""
+    parser = _make_parser(tmp_path, monkeypatch, max_tokens=32)
+
+    assert parser._chunk_text("") == []
+    assert parser._chunk_text("Software Engineer at Acme Corp") == ["Software Engineer at Acme Corp"]
+
+
+def test_chunks_cover_text_and_fit_window(tmp_path, monkeypatch):
+    """Chunks join back to the text, fit the model input and don't split words"""
+    max_tokens = 16
+    parser = _make_parser(tmp_path, monkeypatch, max_tokens=max_tokens)
+    window = max_tokens - parser.tokenizer.num_special_tokens_to_add()
+    rng = random.Random(0)
+
+    for _ in range(50):
+        text = _random_text(rng, rng.randint(1, 120))
+        chunks = parser._chunk_text(text)
+
+        assert "".join(chunks) == text
+        for chunk in chunks:
+            assert _token_count(parser.tokenizer, chunk) <= window
+        for chunk in chunks[1:]:
+            # Every chunk after the first starts at a word boundary
+            assert chunk.split()[0] in WORDS
+
+
+def test_overlong_word_is_cut(tmp_path, monkeypatch):
+    """A single word longer than the window is split rather than looping"""
+    max_tokens = 6
+    parser = _make_parser(tmp_path, monkeypatch, max_tokens=max_tokens)
+    window = max_tokens - parser.tokenizer.num_special_tokens_to_add()
+    text = "develop" + "ing" * 10 + " data"
+
+    chunks = parser._chunk_text(text)
+
+    assert "".join(chunks) == text
+    assert len(chunks) > 1
+    for chunk in chunks:
+        assert _token_count(parser.tokenizer, chunk) <= window
+
+
+if __name__ == "__main__":
+    import pytest
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,77 @@
+"""
+Tests for the NER micro-batcher in ResumeParserService
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from src.api.service import ResumeParserService
+
+
+class FakeNERPipeline:
+    """Stands in for the HF pipeline: a list of texts gives one entity list per text"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts, batch_size=None):
+        self.calls.append(list(texts))
+        return [
+            [{'word': text.split()[0], 'entity_group': 'COMPANY', 'score': 0.9,
+              'start': 0, 'end': len(text.split()[0])}]
+            for text in texts
+        ]
+
+
+def _make_service() -> ResumeParserService:
+    service = ResumeParserService(model_path="unused")
+    service.parser = SimpleNamespace(ner_pipeline=FakeNERPipeline())
+    return service
+
+
+def test_single_request():
+    """A request that arrives alone gets its own flat entity list"""
+    service = _make_service()
+
+    result = asyncio.run(service.extract_ner_entities("Acme Corp hired me"))
+
+    assert service.parser.ner_pipeline.calls == [["Acme Corp hired me"]]
+    assert result.entity_count == 1
+    assert result.entities[0].word == "Acme"
+    assert result.entities[0].entity_group == "COMPANY"
+
+
+def test_concurrent_requests_are_batched():
+    """Concurrent requests share one pipeline call and each gets its own entities"""
+    service = _make_service()
+    texts = [f"Company{i} " + "x" * (10 - i) for i in range(5)]
+
+    async def run():
+        return await asyncio.gather(*[service.extract_ner_entities(text) for text in texts])
+
+    results = asyncio.run(run())
+
+    assert len(service.parser.ner_pipeline.calls) == 1
+    assert sorted(service.parser.ner_pipeline.calls[0]) == sorted(texts)
+    for i, result in enumerate(results):
+        assert result.entity_count == 1
+        assert result.entities[0].word == f"Company{i}"
+
+
+def test_sequential_requests():
+    """Requests arriving one after another each get a correct single result"""
+    service = _make_service()
+
+    async def run():
+        return [await service.extract_ner_entities(f"Company{i} rest") for i in range(3)]
+
+    results = asyncio.run(run())
+
+    assert [r.entities[0].word for r in results] == ["Company0", "Company1", "Company2"]
+
+
+if __name__ == "__main__":
+    test_single_request()
+    test_concurrent_requests_are_batched()
+    test_sequential_requests()
+    print("✅ NER batcher tests passed")
@@ -0,0 +1,46 @@
+"""
+Tests for the content-keyed PDF analysis cache
+"""
+
+import fitz  # PyMuPDF
+
+import src.app._pdf_analysis as pdf_analysis
+
+
+def _make_pdf(path, text, padding):
+    # Same template and size; only the text on the last page differs
+    doc = fitz.open()
+    for _ in range(padding):
+        doc.new_page().insert_text((72, 72), "Curriculum Vitae " * 20)
+    doc.new_page().insert_text((72, 72), text)
+    doc.save(str(path), garbage=0, deflate=False)
+    doc.close()
+    return str(path)
+
+
+def test_cache_key_covers_whole_file():
+    """Files sharing a long prefix and size get different keys"""
+    prefix = b"%PDF-1.7\n" + b"0" * 100_000
+
+    assert pdf_analysis._pdf_cache_key(prefix + b"A") != pdf_analysis._pdf_cache_key(prefix + b"B")
+    assert pdf_analysis._pdf_cache_key(prefix + b"A") == pdf_analysis._pdf_cache_key(prefix + b"A")
+
+
+def test_same_size_pdfs_are_analyzed_separately(tmp_path):
+    """A cached analysis is never reused for a different document"""
+    first = _make_pdf(tmp_path / "first.pdf", "Experience at Company", padding=300)
+    second = _make_pdf(tmp_path / "second.pdf", "Experience at Companz", padding=300)
+    with open(first, 'rb') as f1, open(second, 'rb') as f2:
+        data1, data2 = f1.read(), f2.read()
+    assert len(data1) == len(data2) and data1[:65536] == data2[:65536]
+
+    pdf_analysis._pdf_analysis_cache.clear()
+    pdf_analysis.analyze_pdf(first)
+    pdf_analysis.analyze_pdf(second)
+
+    assert len(pdf_analysis._pdf_analysis_cache) == 2
+
+
+if __name__ == "__main__":
+    import pytest
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,75 @@
+"""
+Tests for API-side PDF text extraction (short in-process, long page-parallel)
+"""
+
+import asyncio
+import subprocess
+import sys
+
+import fitz  # PyMuPDF, only used to build test documents
+import pypdfium2
+
+import src.api.service as service_module
+from src.api.service import ResumeParserService, PDF_PAGE_WORKERS, PDF_PARALLEL_MIN_PAGES
+
+
+def _make_pdf(path, num_pages):
+    doc = fitz.open()
+    for i in range(num_pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page {i + 1} Experience at Company{i}")
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+def _expected_text(path):
+    pdf = pypdfium2.PdfDocument(path)
+    try:
+        return "\n".join(pdf[i].get_textpage().get_text_range() for i in range(len(pdf)))
+    finally:
+        pdf.close()
+
+
+def test_short_pdf_is_extracted_in_process(tmp_path):
+    """Documents below the threshold never touch the process pool"""
+    path = _make_pdf(tmp_path / "short.pdf", 1)
+    ResumeParserService.shutdown()
+
+    text = asyncio.run(ResumeParserService(model_path="unused")._extract_text_from_pdf(path))
+
+    assert text == _expected_text(path)
+    assert "Company0" in text
+    assert service_module._SHARED_PDF_PAGE_EXECUTOR is None
+
+
+def test_long_pdf_is_extracted_in_page_order(tmp_path):
+    """Long documents are split into page ranges and rejoined in order"""
+    num_pages = PDF_PARALLEL_MIN_PAGES + 3
+    path = _make_pdf(tmp_path / "long.pdf", num_pages)
+
+    try:
+        text = asyncio.run(ResumeParserService(model_path="unused")._extract_text_from_pdf(path))
+    finally:
+        ResumeParserService.shutdown()
+
+    assert text == _expected_text(path)
+    positions = [text.index(f"Company{i}") for i in range(num_pages)]
+    assert positions == sorted(positions)
+
+
+def test_page_workers_import_only_pdfium():
+    """Spawned page workers load pdf_text, which doesn't pull in the parser stack"""
+    code = (
+        "import sys, src.api.pdf_text; "
+        "print(sorted(m for m in ('torch', 'transformers', 'src.api.service', 'src.core') if m in sys.modules))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+    assert out.strip() == "[]"
+    assert 1 <= PDF_PAGE_WORKERS <= 4
+
+
+if __name__ == "__main__":
+    import pytest
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,73 @@
+"""
+Tests for SectionLearner saves shared between several learners
+"""
+
+import json
+import multiprocessing
+
+from src.core.section_learner import SectionLearner
+
+
+def _write_config(path):
+    config = {
+        "version": "1.0.0",
+        "sections": {"Skills": {"variants": ["skills"], "confidence_threshold": 0.8}},
+        "learning": {"new_sections_discovered": [], "false_positives": []}
+    }
+    path.write_text(json.dumps(config), encoding='utf-8')
+
+
+def _learn_variants(config_path: str, worker_id: int, count: int):
+    """One worker's learner adding its own variants (runs in a child process)"""
+    learner = SectionLearner(config_path)
+    for i in range(count):
+        learner._add_section_variant("Skills", f"skills variant {worker_id}-{i}")
+
+
+def test_learners_do_not_overwrite_each_other(tmp_path):
+    """Variants saved by one learner survive saves from learners loaded earlier"""
+    config_path = tmp_path / "sections_database.json"
+    _write_config(config_path)
+
+    first = SectionLearner(str(config_path))
+    second = SectionLearner(str(config_path))
+    first._add_section_variant("Skills", "tech toolkit")
+    second._add_section_variant("Skills", "core stack")
+    second._mark_false_positive("Acme Corp")
+
+    saved = json.loads(config_path.read_text(encoding='utf-8'))
+    assert {"skills", "tech toolkit", "core stack"} <= set(saved["sections"]["Skills"]["variants"])
+    assert saved["learning"]["false_positives"] == ["Acme Corp"]
+
+
+def test_concurrent_worker_saves(tmp_path):
+    """Learners in several processes keep every variant and never leave partial JSON"""
+    config_path = tmp_path / "sections_database.json"
+    _write_config(config_path)
+    workers, count = 4, 15
+
+    processes = [
+        multiprocessing.Process(target=_learn_variants, args=(str(config_path), worker_id, count))
+        for worker_id in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    while any(process.is_alive() for process in processes):
+        json.loads(config_path.read_text(encoding='utf-8'))
+    for process in processes:
+        process.join()
+        assert process.exitcode == 0
+
+    variants = set(json.loads(config_path.read_text(encoding='utf-8'))["sections"]["Skills"]["variants"])
+    expected = {f"skills variant {w}-{i}" for w in range(workers) for i in range(count)}
+    assert expected <= variants
+
+
+if __name__ == "__main__":
+    import tempfile
+    from pathlib import Path
+
+    for test in (test_learners_do_not_overwrite_each_other, test_concurrent_worker_saves):
+        with tempfile.TemporaryDirectory() as tmp:
+            test(Path(tmp))
+    print("✅ Section learner tests passed")
@@ -0,0 +1,67 @@
+"""
+Tests for the persistent parse-result cache in ResumeParserService
+"""
+
+import time
+
+import src.api.service as service_module
+from src.api.service import ResumeParserService
+
+
+class BrokenDisk:
+    """Cache whose reads fail, like a corrupt or locked diskcache"""
+
+    def get(self, key):
+        raise OSError("database disk image is malformed")
+
+
+class DictDisk(dict):
+    """In-memory stand-in for diskcache.Cache"""
+
+    def set(self, key, value, expire=None):
+        self[key] = value
+
+
+def test_cache_is_opt_in(monkeypatch):
+    """Without RESUME_CACHE_DIR no cache is opened"""
+    monkeypatch.delenv("RESUME_CACHE_DIR", raising=False)
+    monkeypatch.setattr(ResumeParserService, "warmup", lambda self: None)
+    monkeypatch.setattr(service_module, "_get_shared_parser", lambda model_path: None)
+    monkeypatch.setattr(service_module, "UnifiedResumeParser", None)
+    monkeypatch.setattr(service_module, "SECTION_SPLITTER_AVAILABLE", False)
+
+    service = ResumeParserService(model_path="unused")
+    service.initialize()
+
+    assert service._disk is None
+
+
+def test_cache_read_errors_are_misses():
+    """A failing cache read is treated as a miss instead of failing the request"""
+    service = ResumeParserService(model_path="unused")
+    service._disk = BrokenDisk()
+
+    assert service._cache_get("key", time.time()) is None
+
+
+def test_outdated_entries_are_misses():
+    """An entry that no longer fits the result model is a miss"""
+    service = ResumeParserService(model_path="unused")
+    service._disk = DictDisk(key={'experiences': 'not a list'})
+
+    assert service._cache_get("key", time.time()) is None
+
+
+def test_cache_key_includes_version(monkeypatch):
+    """Bumping RESULT_CACHE_VERSION changes every key"""
+    service = ResumeParserService(model_path="unused")
+    before = service._cache_key("resume text", "cv.pdf")
+
+    monkeypatch.setattr(service_module, "RESULT_CACHE_VERSION", service_module.RESULT_CACHE_VERSION + 1)
+
+    assert service._cache_key("resume text", "cv.pdf") != before
+
+
+if __name__ == "__main__":
+    import pytest
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -18,12 +18,12 @@ def check_python_version():
     """Check Python version"""
     print("\n🐍 Checking Python version...")
     version = sys.version_info
-    if version.major == 3 and version.minor >= 8:
+    if version.major == 3 and version.minor >= 10:
         print(f"   ✅ Python {version.major}.{version.minor}.{version.micro}")
         return True
     else:
         print(f"   ❌ Python {version.major}.{version.minor}.{version.micro}")
-        print(f"   Required: Python 3.8 or higher")
+        print(f"   Required: Python 3.10 or higher")
         return False
 
 
@@ -55,6 +55,7 @@ def check_dependencies():
         ("pandas", "pandas"),
         ("numpy", "numpy"),
         ("PyPDF2", "PyPDF2"),
+        ("pypdfium2", "pypdfium2"),
         ("python-docx", "docx"),
         ("sentence-transformers", "sentence_transformers"),
     ]